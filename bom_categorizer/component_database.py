@@ -43,6 +43,7 @@ import os
 import shutil
 import hashlib
 import sys
+from functools import lru_cache
 from typing import Optional, Dict, List
 from datetime import datetime
 
@@ -67,12 +68,14 @@ def safe_print(message: str):
 
 
 # Путь к файлу базы данных (в папке с данными пользователя)
+@lru_cache(maxsize=1)
 def get_database_path() -> str:
     r"""
     Получить путь к файлу базы данных компонентов
     
     База данных хранится в отдельной пользовательской папке,
     которая НЕ удаляется при деинсталляции программы.
+    Путь вычисляется один раз за время работы процесса.
     
     Расположение:
     - Windows: C:\Users\USERNAME\AppData\Roaming\BOMCategorizer\Data\component_database.json
@@ -127,6 +130,17 @@ CATEGORY_NAMES = {
 }
 
 
+# Кэш статистики и истории: {(путь, mtime_ns, размер): (stats, history)} - файл перечитывается
+# только после изменения. Функции записи БД очищают его явно: mtime на части файловых систем
+# грубый, а shutil.copy2 переносит в БД время модификации исходного файла.
+_stats_cache: Dict[tuple, tuple] = {}
+
+
+def invalidate_database_stats_cache() -> None:
+    """Сбрасывает кэш статистики БД (после записи файла БД в обход функций этого модуля)"""
+    _stats_cache.clear()
+
+
 def _calculate_database_hash(components: Dict[str, str]) -> str:
     """
     Вычисляет SHA256 хэш базы данных компонентов
@@ -259,6 +273,7 @@ def set_database_version(new_version: str) -> bool:
         # Сохраняем
         with open(db_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        _stats_cache.clear()
         
         safe_print(f"✅ Версия БД изменена: {old_version} → {new_version}")
         return True
@@ -428,6 +443,7 @@ def _save_structured_database(structured_db: dict) -> None:
     try:
         with open(db_path, 'w', encoding='utf-8') as f:
             json.dump(structured_db, f, ensure_ascii=False, indent=2, sort_keys=False)
+        _stats_cache.clear()
     except Exception as e:
         safe_print(f"⚠️ Ошибка сохранения базы данных компонентов: {e}")
 
@@ -591,25 +607,81 @@ def get_component_category(component_name: str) -> Optional[str]:
     return None
 
 
-def get_database_history() -> List[dict]:
+def _load_database_summary() -> tuple:
     """
-    Получает историю изменений базы данных
+    Читает статистику и историю БД за одно чтение файла
+    
+    Результат кэшируется до изменения файла БД (время модификации или размер).
     
     Returns:
-        Список записей истории (последние N записей)
+        Кортеж (stats, history)
     """
     db_path = get_database_path()
     
-    if not os.path.exists(db_path):
-        return []
+    try:
+        db_stat = os.stat(db_path)
+    except OSError:
+        return {
+            'metadata': {},
+            'total': 0,
+            'by_category': {}
+        }, []
+    
+    cache_key = (db_path, db_stat.st_mtime_ns, db_stat.st_size)
+    cached = _stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
     try:
         with open(db_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            return data.get("history", [])
+            
+            # Новый формат с метаданными
+            if "components" in data:
+                components = data["components"]
+                metadata = data.get("metadata", {})
+                history = data.get("history", [])
+            else:
+                # Старый формат
+                components = data
+                metadata = {}
+                history = []
+            
+            stats = {
+                'metadata': metadata,
+                'total': len(components),
+                'by_category': {},
+                'category_names': CATEGORY_NAMES
+            }
+            
+            for category in components.values():
+                if category not in stats['by_category']:
+                    stats['by_category'][category] = 0
+                stats['by_category'][category] += 1
+            
+            _stats_cache.clear()
+            _stats_cache[cache_key] = (stats, history)
+            return stats, history
     except Exception as e:
-        safe_print(f"⚠️ Ошибка чтения истории БД: {e}")
-        return []
+        safe_print(f"⚠️ Ошибка получения статистики: {e}")
+        return {
+            'metadata': {},
+            'total': 0,
+            'by_category': {}
+        }, []
+
+
+def get_database_history() -> List[dict]:
+    """
+    Получает историю изменений базы данных
+    
+    Результат кэшируется вместе со статистикой (см. get_database_stats).
+    Возвращаемый список не следует изменять.
+    
+    Returns:
+        Список записей истории (последние N записей)
+    """
+    return _load_database_summary()[1]
 
 
 def format_history_tooltip() -> str:
@@ -718,6 +790,7 @@ def clear_database() -> bool:
         # Сохраняем пустую базу
         with open(db_path, 'w', encoding='utf-8') as f:
             json.dump(empty_db, f, ensure_ascii=False, indent=2)
+        _stats_cache.clear()
         
         safe_print(f"✅ База данных очищена: {db_path}")
         return True
@@ -731,51 +804,13 @@ def get_database_stats() -> dict:
     """
     Получает расширенную статистику по базе данных
     
+    Результат кэшируется до изменения файла БД (время модификации или размер).
+    Возвращаемый словарь не следует изменять.
+    
     Returns:
         Словарь со статистикой и метаданными
     """
-    db_path = get_database_path()
-    
-    if not os.path.exists(db_path):
-        return {
-            'metadata': {},
-            'total': 0,
-            'by_category': {}
-        }
-    
-    try:
-        with open(db_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-            # Новый формат с метаданными
-            if "components" in data:
-                components = data["components"]
-                metadata = data.get("metadata", {})
-            else:
-                # Старый формат
-                components = data
-                metadata = {}
-            
-            stats = {
-                'metadata': metadata,
-                'total': len(components),
-                'by_category': {},
-                'category_names': CATEGORY_NAMES
-            }
-            
-            for category in components.values():
-                if category not in stats['by_category']:
-                    stats['by_category'][category] = 0
-                stats['by_category'][category] += 1
-            
-            return stats
-    except Exception as e:
-        safe_print(f"⚠️ Ошибка получения статистики: {e}")
-        return {
-            'metadata': {},
-            'total': 0,
-            'by_category': {}
-        }
+    return _load_database_summary()[0]
 
 
 def export_database_to_excel(output_path: str = "component_database_export.xlsx") -> bool:
@@ -1016,6 +1051,7 @@ def initialize_database_from_template():
         import shutil
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         shutil.copy2(template_path, db_path)
+        _stats_cache.clear()
         safe_print(f"✅ Инициализирована БД из шаблона: {db_path}")
     else:
         # Если шаблона нет - создаем пустую БД
@@ -5,6 +5,7 @@
 
 import os
 import sys
+from operator import itemgetter
 from typing import Optional, List, Tuple
 
 from PySide6.QtWidgets import (
@@ -181,7 +182,7 @@ class DatabaseStatsDialog(QDialog):
         categories = self.stats.get('by_category', {})
         if categories:
             text += "📦 Распределение по категориям:\n"
-            for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+            for category, count in sorted(categories.items(), key=itemgetter(1), reverse=True):
                 # Визуальный прогресс-бар
                 bar_length = int((count / metadata.get('total_components', 1)) * 30)
                 bar = "█" * bar_length + "░" * (30 - bar_length)
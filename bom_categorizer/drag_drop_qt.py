@@ -378,10 +378,7 @@ def enable_drag_drop_improvements(window):
     if hasattr(window, 'files_list'):
         # Сохраняем текущие элементы
         old_list = window.files_list
-        items = []
-        for i in range(old_list.count()):
-            item = old_list.item(i)
-            items.append(item.text())
+        items = [old_list.item(i).text() for i in range(old_list.count())]
         
         # Создаем новый список с D&D
         parent = old_list.parent()
@@ -389,10 +386,12 @@ def enable_drag_drop_improvements(window):
         
         new_list = DragDropListWidget("input_files", window)
         new_list.setMaximumHeight(old_list.maximumHeight())
+        new_list.setUniformItemSizes(old_list.uniformItemSizes())
+        new_list.setLayoutMode(old_list.layoutMode())
+        new_list.setBatchSize(old_list.batchSize())
         
-        # Восстанавливаем элементы
-        for item_text in items:
-            new_list.addItem(item_text)
+        # Восстанавливаем элементы одним вызовом
+        new_list.addItems(items)
         
         # Подключаем обработчики
         new_list.itemSelectionChanged.connect(window.on_file_selected)
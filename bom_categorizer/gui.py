@@ -27,7 +27,8 @@ from .component_database import (
     backup_database,
     is_first_run,
     initialize_database_from_template,
-    format_history_tooltip
+    format_history_tooltip,
+    invalidate_database_stats_cache
 )
 
 from .config_manager import initialize_all_configs
@@ -1919,6 +1920,7 @@ class BOMCategorizerApp(tk.Tk):
             # Копируем новую базу данных
             import shutil
             shutil.copy2(file_path, current_db_path)
+            invalidate_database_stats_cache()
             
             # Проверяем что копирование прошло успешно
             new_stats = get_database_stats()
@@ -2238,6 +2240,7 @@ class BOMCategorizerApp(tk.Tk):
                     import shutil
                     db_path = get_database_path()
                     shutil.copy2(file_path, db_path)
+                    invalidate_database_stats_cache()
                     stats = get_database_stats()
                     imported_count = stats.get('total_components', 0)
                 elif file_path.endswith('.xlsx'):
@@ -12,20 +12,25 @@ PySide6-интерфейс с поддержкой:
 import os
 import json
 import sys
+import stat
+import logging
 import platform
 import re
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Optional, List
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QGroupBox, QPushButton, QLabel, QLineEdit,
     QListWidget, QListWidgetItem, QSpinBox, QCheckBox, QTextEdit, QTextBrowser,
+    QPlainTextEdit,
     QFileDialog, QMessageBox, QScrollArea, QFrame, QDialog, QMenuBar, QMenu,
-    QProgressDialog, QTableWidget, QTableWidgetItem, QHeaderView,
+    QProgressDialog, QTableView, QHeaderView,
     QAbstractItemView
 )
-from PySide6.QtCore import Qt, Signal, QThread, QSize, QUrl
+from PySide6.QtCore import Qt, Signal, QObject, QThread, QThreadPool, QTimer, QSize, QUrl, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont, QColor, QPalette, QAction, QActionGroup, QKeySequence, QDragEnterEvent, QDropEvent, QCursor
 import subprocess
 
@@ -41,7 +46,8 @@ from .component_database import (
     set_database_version,
     is_first_run,
     initialize_database_from_template,
-    format_history_tooltip
+    format_history_tooltip,
+    invalidate_database_stats_cache
 )
 
 from .config_manager import initialize_all_configs
@@ -57,11 +63,89 @@ from .dialogs_qt import (
 from .styles import DARK_THEME, LIGHT_THEME
 
 # Импорты из новых модулей
-from .workers_qt import ProcessingWorker, ComparisonWorker
+from .workers_qt import ProcessingWorker, ComparisonWorker, DatabaseTaskWorker, FileCheckWorker
 from .search_qt import GlobalSearchDialog
 from . import gui_sections_qt
 from . import search_methods_qt
 
+logger = logging.getLogger(__name__)
+
+
+# Платформа не меняется во время работы - определяем один раз при импорте
+_IS_WINDOWS = sys.platform.startswith('win')
+_IS_MAC = sys.platform == 'darwin'
+
+# Регулярные выражения контекстной помощи (компилируются один раз)
+_HTML_TAG_RE = re.compile(r'<[^<]+?>')  # HTML теги (для копирования в буфер обмена)
+
+# Подписи режимов работы: {режим: текст} (цвет - в _STATUS_LABELS_QSS)
+_MODE_TITLES = {
+    "simple": "Режим: Простой",
+    "advanced": "Режим: Расширенный",
+    "expert": "Режим: Эксперт",
+}
+
+# Короткие имена AI провайдеров для статуса: {провайдер: имя}
+_PROVIDER_NAMES = {
+    "anthropic": "Claude",
+    "openai": "GPT",
+    "ollama": "Ollama",
+}
+
+# Типы объектов, которые обновляются при масштабировании: {класс: список в _collect_scalable_children}
+_SCALABLE_BUCKETS = {
+    QMenu: 'menus',
+    QMenuBar: 'menubar',
+    QPushButton: 'buttons',
+    QLineEdit: 'line_edits',
+    QSpinBox: 'spin_boxes',
+    QVBoxLayout: 'layouts',
+    QHBoxLayout: 'layouts',
+}
+
+# Расширения файлов, принимаемых через Drag & Drop
+_SUPPORTED_EXTS = ('.xlsx', '.docx', '.doc', '.txt')
+
+# Начиная с этого числа перетащенных файлов они проверяются на диске в фоновом потоке
+_DROP_SYNC_LIMIT = 20
+
+# Руководство по Drag & Drop в корне проекта
+_DRAGDROP_README_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "DRAG_DROP_README.md"
+)
+
+
+def _set_visible(target, visible: bool) -> None:
+    """Меняет видимость виджета или QAction, только если она отличается"""
+    if isinstance(target, QAction):
+        changed = target.isVisible() != visible
+    else:
+        # isHidden() - явное скрытие самого виджета (isVisible() зависит еще и от родителей)
+        changed = target.isHidden() == visible
+    if changed:
+        target.setVisible(visible)
+
+
+def _set_checkbox_state(checkbox: QCheckBox, enabled: bool, checked: bool) -> None:
+    """Устанавливает доступность и состояние флажка без сигналов и лишних обновлений"""
+    # WA_ForceDisabled - явное отключение самого флажка (isEnabled() зависит еще и от родителей)
+    if checkbox.testAttribute(Qt.WA_ForceDisabled) == enabled:
+        checkbox.setEnabled(enabled)
+    if checkbox.isChecked() != checked:
+        blocked = checkbox.blockSignals(True)
+        checkbox.setChecked(checked)
+        checkbox.blockSignals(blocked)
+
+
+def _set_style_state(widget: QWidget, name: str, value: str) -> None:
+    """Меняет динамическое свойство для селекторов QSS и переприменяет стиль виджета"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
 
 def get_config_path() -> str:
     """Определяет путь к config_qt.json (Modern Edition)"""
@@ -71,7 +155,7 @@ def get_config_path() -> str:
         return dev_path
     
     # 2. В папке установки для Windows (установленная версия)
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         appdata = os.environ.get('APPDATA', os.path.expanduser('~'))
         installed_path = os.path.join(appdata, 'BOMCategorizerModern', 'config_qt.json')
         installed_dir = os.path.dirname(installed_path)
@@ -86,7 +170,7 @@ def get_config_path() -> str:
             return installed_path
     
     # 3. В папке Application Support для macOS (установленная версия)
-    if platform.system() == 'Darwin':  # macOS
+    if _IS_MAC:  # macOS
         app_support = os.path.expanduser('~/Library/Application Support')
         installed_path = os.path.join(app_support, 'BOMCategorizerModern', 'config_qt.json')
         installed_dir = os.path.dirname(installed_path)
@@ -106,7 +190,7 @@ def get_config_path() -> str:
     
     # 4. В случае .app bundle на macOS (Contents/Resources/) - только если frozen
     if getattr(sys, 'frozen', False):
-        if platform.system() == 'Darwin':  # macOS
+        if _IS_MAC:  # macOS
             bundle_dir = os.path.dirname(os.path.dirname(sys.executable))
             bundle_path = os.path.join(bundle_dir, "Resources", "config_qt.json")
             if os.path.exists(bundle_path):
@@ -132,23 +216,860 @@ def load_config() -> dict:
     return {"app_info": {"version": "4.4.5", "edition": "Modern Edition", "description": "BOM Categorizer Modern Edition"}}
 
 
+@lru_cache(maxsize=None)
 def get_system_font() -> str:
     """
     Возвращает подходящий системный шрифт для текущей ОС
 
+    Результат кэшируется (платформа не меняется во время работы).
+
     Returns:
         str: Название шрифта
     """
-    system = platform.system()
-
-    if system == 'Darwin':  # macOS
+    if _IS_MAC:
         return 'SF Pro Text'
-    elif system == 'Windows':
+    elif _IS_WINDOWS:
         return 'Segoe UI'
     else:  # Linux и другие
         return 'DejaVu Sans'
 
 
+# Маппинг действий истории БД на русские названия
+_ACTION_NAMES = {
+    "initial_creation": "Создание БД",
+    "conversion_from_old_format": "Конвертация из старого формата",
+    "manual_add": "Ручное добавление",
+    "import_from_file": "Импорт из файла",
+    "import_from_excel": "Импорт из Excel",
+    "update": "Обновление",
+    "database_cleared": "Очистка БД",
+    "manual_version_change": "Смена версии"
+}
+
+
+# Стиль таблицы истории БД; добавляется к стилям главного окна в apply_theme(),
+# поэтому разбирается один раз при смене темы, а не при каждом открытии диалога
+_HISTORY_TABLE_QSS = """
+QTableView#historyTable {
+    background-color: #1f2335;
+    alternate-background-color: #262a3d;
+    color: #cdd6f4;
+    border: 1px solid #2e3247;
+    gridline-color: #2e3247;
+}
+QTableView#historyTable QHeaderView::section {
+    background-color: #313244;
+    color: #f5e0dc;
+    padding: 6px 8px;
+    border: none;
+    font-weight: 600;
+}
+QTableView#historyTable::item {
+    padding: 4px 6px;
+}
+QTableView#historyTable::item:selected {
+    background-color: #3b4376;
+    color: #f8faff;
+}
+"""
+
+# Цвета меток футера и статуса AI; добавляются к стилям главного окна в apply_theme(),
+# состояние переключается динамическими свойствами (_set_style_state), а не setStyleSheet
+_STATUS_LABELS_QSS = """
+QLabel#modeLabel { color: #cdd6f4; font-weight: bold; }
+QLabel#modeLabel[mode="simple"] { color: #fab387; }
+QLabel#modeLabel[mode="advanced"] { color: #89b4fa; }
+QLabel#modeLabel[mode="expert"] { color: #f38ba8; }
+QLabel#dbLocationAppdata, QLabel#windowSizeLabel { color: #89b4fa; font-weight: bold; }
+QLabel#dbLocationAppdata:hover, QLabel#windowSizeLabel:hover { color: #74c7ec; }
+QLabel#dbLocationLocal { color: #f9e2af; font-weight: bold; }
+QLabel[aiStatus="off"] { color: #6c7086; }
+QLabel[aiStatus="warn"] { color: #fab387; }
+QLabel[aiStatus="ok"] { color: #a6e3a1; }
+"""
+
+# Кнопка экспорта в PDF (QPushButton#exportPdfButton); правила разбираются вместе со стилями окна
+_EXPORT_PDF_BUTTON_QSS = """
+QPushButton#exportPdfButton {
+    background-color: #f38ba8;
+    color: white;
+    border: none;
+    border-radius: 5px;
+    padding: 8px 15px;
+    font-weight: bold;
+}
+QPushButton#exportPdfButton:hover {
+    background-color: #f5c2e7;
+}
+QPushButton#exportPdfButton:disabled {
+    background-color: #6c7086;
+    color: #45475a;
+}
+"""
+
+# Шрифт строки меню (задается через stylesheet при изменении масштаба)
+_MENUBAR_QSS_TMPL = (
+    "QMenuBar {{ font-size: {size}pt; font-family: '{family}'; }}"
+    "QMenuBar::item {{ font-size: {size}pt; font-family: '{family}'; }}"
+)
+
+# Шаблоны сообщений операций с базой данных
+_CLEAR_CONFIRM_TMPL = (
+    "⚠️ Вы уверены, что хотите очистить базу данных?\n\n"
+    "Текущее количество компонентов: {total}\n\n"
+    "❗ Это действие создаст резервную копию старой базы,\n"
+    "но все компоненты будут удалены из основной базы.\n\n"
+    "Продолжить?"
+)
+_CLEAR_SUCCESS_TMPL = (
+    "✅ База данных успешно очищена!\n\n"
+    "Удалено компонентов: {total}\n\n"
+    "Резервная копия старой базы сохранена в папке:\n"
+    "{backup_dir}\n\n"
+    "Информация в футере обновлена!"
+)
+_VERSION_PROMPT_TMPL = (
+    "Текущая версия: {current_version}\n\n"
+    "Введите новую версию в формате X.Y:\n"
+    "(X увеличивается при импорте из файлов,\n"
+    "Y увеличивается при ручном добавлении элементов)\n"
+    "Версия 0.0 означает пустую базу после очистки."
+)
+_VERSION_SUCCESS_TMPL = (
+    "✅ Версия БД успешно изменена!\n\n"
+    "Старая версия: {current_version}\n"
+    "Новая версия: {new_version}\n\n"
+    "Запись добавлена в историю БД.\n"
+    "Информация в футере обновлена!"
+)
+_EXPORT_SUCCESS_TMPL = (
+    "✅ База данных успешно экспортирована!\n\n"
+    "Файл: {file_path}\n"
+    "Компонентов: {row_count}"
+)
+_IMPORT_SUCCESS_TMPL = (
+    "✅ База данных успешно импортирована!\n\n"
+    "Компонентов импортировано: {imported_count}\n"
+    "База данных: {db_path}\n\n"
+    "Информация в футере обновлена!"
+)
+
+# Шаблон HTML для диалога "О программе"
+_ABOUT_TEMPLATE = """
+<h2>BOM Categorizer {edition}</h2>
+<p><b>Версия:</b> {version}</p>
+<p><b>Разработчик:</b> Куреин М.Н. / Kurein M.N.</p>
+<p><b>Дата выпуска:</b> {release_date}</p>
+
+<p><b>Возможности:</b></p>
+<ul>
+<li>📋 Обработка файлов: XLSX, DOCX, TXT</li>
+<li>🤖 Автоматическая классификация компонентов</li>
+<li>🎨 Форматирование и сортировка</li>
+<li>🗄️ База данных компонентов с версионированием</li>
+<li>🖥️ Современный темный/светлый интерфейс</li>
+<li>🔒 PIN защита</li>
+<li>💾 Экспорт в Excel и TXT</li>
+<li>📊 Сравнение BOM файлов</li>
+<li>🔍 Контекстная помощь (F1)</li>
+</ul>
+
+<p><b>Горячие клавиши:</b></p>
+<ul>
+<li><b>Ctrl+O</b> - Открыть файлы</li>
+<li><b>Ctrl+R</b> - Запустить обработку</li>
+<li><b>Ctrl+Q</b> - Выход</li>
+<li><b>F1</b> - Контекстная помощь</li>
+<li><b>Ctrl+T</b> - Переключить тему</li>
+<li><b>Ctrl+Plus/Minus</b> - Изменить масштаб</li>
+<li><b>Ctrl+0</b> - Сбросить масштаб</li>
+</ul>
+
+<p><b>Drag & Drop:</b></p>
+<p>Перетащите файлы (XLSX, DOCX, DOC, TXT) прямо в окно приложения для быстрого добавления.</p>
+
+<p><b>Лицензия:</b></p>
+<p style="font-size: 10pt;">
+Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
+Все права защищены.<br><br>
+Данное программное обеспечение предоставляется "как есть", без каких-либо явных или подразумеваемых гарантий, включая, но не ограничиваясь гарантиями товарной пригодности, пригодности для определенной цели и отсутствия нарушений прав.<br><br>
+В случае возникновения вопросов или проблем обращайтесь к разработчику.
+</p>
+
+<p style="color: #7287fd;"><b>Modern Edition</b> на основе PySide6 (Qt)</p>
+"""
+
+
+@lru_cache(maxsize=32)
+def format_hash(value: str) -> str:
+    """
+    Разбивает хэш на группы по 16 символов для отображения
+
+    Результат кэшируется: хэш меняется только при записи в БД.
+
+    Args:
+        value: Хэш в виде hex-строки
+
+    Returns:
+        str: Хэш группами через пробел или '—' для пустого значения
+    """
+    if not value:
+        return '—'
+    return ' '.join(value[i:i + 16] for i in range(0, len(value), 16))
+
+
+@lru_cache(maxsize=1)
+def _static_system_info_html() -> str:
+    """
+    Возвращает HTML с информацией об ОС и Python
+
+    Эти данные не меняются во время работы, а platform.processor()
+    на некоторых системах запускает внешний процесс - поэтому результат кэшируется.
+    """
+    return f"""
+<h2>💻 Системная информация</h2>
+
+<h3>Операционная система:</h3>
+<p><b>Платформа:</b> {platform.system()} {platform.release()}</p>
+<p><b>Версия:</b> {platform.version()}</p>
+<p><b>Архитектура:</b> {platform.machine()}</p>
+<p><b>Процессор:</b> {platform.processor()}</p>
+
+<h3>Python:</h3>
+<p><b>Версия:</b> {sys.version.split()[0]}</p>
+<p><b>Путь к интерпретатору:</b> {sys.executable}</p>
+<p><b>Платформа Python:</b> {platform.python_implementation()} {platform.python_version()}</p>
+"""
+
+
+class DatabaseHistoryModel(QAbstractTableModel):
+    """
+    Модель таблицы истории базы данных
+
+    Данные берутся напрямую из списка history при отрисовке видимых строк,
+    без создания QTableWidgetItem на каждую ячейку.
+    """
+
+    HEADERS = ("Версия", "Дата/Время", "Действие", "Источник", "Добавлено")
+    SOURCE_COLUMN = 3
+    # Выравнивание по колонкам (None - выравнивание по умолчанию)
+    COLUMN_ALIGNMENTS = (int(Qt.AlignCenter), int(Qt.AlignCenter), None, None, int(Qt.AlignCenter))
+    # Роли, для которых модель отдает данные; остальные запросы делегата отсекаются сразу
+    _SERVED_ROLES = frozenset((Qt.DisplayRole, Qt.TextAlignmentRole, Qt.ToolTipRole))
+
+    def __init__(self, history: List[dict], parent=None):
+        super().__init__(parent)
+        self._rows = history
+
+    def set_history(self, history: List[dict]):
+        """Заменяет данные модели одним сбросом"""
+        self.beginResetModel()
+        self._rows = history
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in self._SERVED_ROLES or not index.isValid():
+            return None
+
+        column = index.column()
+        if role == Qt.TextAlignmentRole:
+            return self.COLUMN_ALIGNMENTS[column]
+
+        entry = self._rows[index.row()]
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return str(entry.get('version', 'N/A'))
+            if column == 1:
+                return entry.get('timestamp', '')
+            if column == 2:
+                action = entry.get('action', '')
+                return _ACTION_NAMES.get(action, action)
+            if column == 3:
+                return entry.get('source', '-')
+            return str(entry.get('components_added', 0))
+
+        if role == Qt.ToolTipRole and column == self.SOURCE_COLUMN:
+            return entry.get('source', '-')
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class DatabaseViewDialog(QDialog):
+    """
+    Диалог просмотра базы данных с историей формирования
+
+    Создается один раз главным окном и переиспользуется: при каждом
+    открытии вызывается refresh() с актуальными данными.
+    """
+
+    def __init__(self, parent: 'BOMCategorizerMainWindow'):
+        super().__init__(parent)
+        self.main_window = parent
+        self.scale_factor = parent.scale_factor
+
+        self.setWindowTitle("👁️ Просмотр базы данных")
+        self.resize(900, 700)
+
+        self._create_ui()
+
+    def _create_ui(self):
+        """Создает элементы диалога"""
+        layout = QVBoxLayout()
+
+        # Информация о базе данных
+        self.info_label = QLabel()
+        self.info_label.setProperty("class", "bold")
+        
+        # Применяем крупный шрифт для читаемости (базовый 14pt)
+        info_font_size = max(11, int(14 * self.scale_factor))
+        self.info_label.setFont(self.main_window._font(info_font_size))
+        layout.addWidget(self.info_label)
+
+        # История формирования
+        history_group = QGroupBox("📜 История формирования базы данных")
+        history_layout = QVBoxLayout()
+        
+        # Подсказка
+        hint_label = QLabel("💡 Дважды кликните на строку с файлом-источником, чтобы открыть его в проводнике")
+        hint_font_size = max(11, int(14 * self.scale_factor))
+        hint_label.setFont(self.main_window._font(hint_font_size))
+        hint_label.setStyleSheet("color: #89b4fa; font-style: italic; padding: 5px;")
+        history_layout.addWidget(hint_label)
+
+        # Создаем таблицу для истории
+        history_table = QTableView()
+        # Модель отдает данные из history по запросу представления
+        self.history_model = DatabaseHistoryModel([], history_table)
+        history_table.setModel(self.history_model)
+        
+        # Применяем крупный шрифт к таблице для читаемости (базовый 14pt)
+        # Для Windows уменьшаем на 3 пункта (было 2, теперь еще на 1 меньше)
+        base_font_size = 11 if _IS_WINDOWS else 14  # Уменьшаем на 3 пункта для Windows
+        table_font_size = max(10, int(base_font_size * self.scale_factor))
+        history_table.setFont(self.main_window._font(table_font_size))
+        # Заголовки таблицы чуть крупнее и жирные
+        history_table.horizontalHeader().setFont(self.main_window._font(table_font_size + 2, bold=True))
+        
+        # Ширина колонок подгоняется в refresh() (ResizeToContents
+        # пересчитывает размеры при каждом изменении данных)
+        history_table.horizontalHeader().setStretchLastSection(False)
+        history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        history_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
+        history_table.horizontalHeader().setHighlightSections(False)
+        history_table.horizontalHeader().setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+
+        history_table.verticalHeader().setVisible(False)
+        # Увеличенная высота строк для крупных шрифтов (базовая 40px)
+        row_height = max(36, int(40 * self.scale_factor))
+        history_table.verticalHeader().setDefaultSectionSize(row_height)
+        history_table.setAlternatingRowColors(True)
+        history_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        history_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        history_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        history_table.setFocusPolicy(Qt.NoFocus)
+        history_table.setWordWrap(False)
+        history_table.setShowGrid(False)
+        history_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        history_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        history_table.setCursor(Qt.PointingHandCursor)  # Курсор-указатель для подсказки о клике
+        # Стиль задается селектором #historyTable в стилях главного окна (_HISTORY_TABLE_QSS)
+        history_table.setObjectName("historyTable")
+
+        # Обработчик двойного клика для открытия файла-источника в проводнике
+        history_table.doubleClicked.connect(self._on_history_double_clicked)
+        history_layout.addWidget(history_table)
+        self.history_table = history_table
+
+        self.no_history_label = QLabel("История пуста")
+        history_layout.addWidget(self.no_history_label)
+
+        history_group.setLayout(history_layout)
+        layout.addWidget(history_group)
+
+        # Кнопки
+        button_layout = QHBoxLayout()
+        
+        # Крупный шрифт для кнопок (базовый 14pt)
+        button_font_size = max(12, int(14 * self.scale_factor))
+        button_font = self.main_window._font(button_font_size)
+        
+        export_btn = QPushButton("📤 Экспорт в Excel")
+        export_btn.setFont(button_font)
+        export_btn.clicked.connect(self.main_window.export_database)
+        button_layout.addWidget(export_btn)
+        
+        button_layout.addStretch()
+        
+        close_btn = QPushButton("Закрыть")
+        close_btn.setFont(button_font)
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def refresh(self, stats: dict, history: List[dict]):
+        """
+        Обновляет информацию о БД и таблицу истории
+
+        Args:
+            stats: Статистика из get_database_stats()
+            history: История из get_database_history()
+        """
+        metadata = stats.get('metadata', {})
+        formatted_hash = format_hash(metadata.get('current_hash', '') or '')
+        formatted_prev_hash = format_hash(metadata.get('previous_hash', '') or '')
+
+        info_text = f"""
+        <h3>📊 Информация о базе данных</h3>
+        <p><b>Версия:</b> {metadata.get('version', 'N/A')}</p>
+        <p><b>Последнее обновление:</b> {metadata.get('last_updated', 'N/A')}</p>
+        <p><b>Всего компонентов:</b> {stats.get('total', 0)}</p>
+        <p><b>Путь:</b> {get_database_path()}</p>
+        <p><b>Текущий хэш:</b> <code>{formatted_hash}</code></p>
+        <p><b>Предыдущий хэш:</b> <code>{formatted_prev_hash}</code></p>
+        """
+        self.info_label.setText(info_text)
+
+        self.history_model.set_history(history)
+        self.history_table.setVisible(bool(history))
+        self.no_history_label.setVisible(not history)
+        if history:
+            self.history_table.resizeColumnsToContents()
+
+    def _on_history_double_clicked(self, index):
+        """Открывает файл-источник выбранной строки истории"""
+        source_index = self.history_model.index(index.row(), DatabaseHistoryModel.SOURCE_COLUMN)
+        if source_index.isValid():
+            self.main_window.open_history_source(source_index.data(), self)
+
+
+# Справка по элементам интерфейса для контекстной помощи (F1): {тип виджета: {текст: HTML}}
+_HELP_MAP = {
+    # Ключи без эмодзи: варианты текста кнопок сводятся к ним через _normalize_help_key()
+    'QPushButton': {
+        'Добавить файлы': '📂 <b>Добавить файлы</b><br><br>'
+            'Добавляет BOM файлы для обработки. Поддерживаются форматы:<br>'
+            '• Excel (.xlsx) - основной формат<br>'
+            '• Word (.docx, .doc) - автоматически конвертируется<br>'
+            '• Текст (.txt) - простой текстовый формат<br><br>'
+            'Можно выбрать несколько файлов одновременно.<br>'
+            'Также можно перетащить файлы прямо в окно приложения.<br><br>'
+            '<b>Горячая клавиша:</b> Ctrl+O',
+        'Очистить список': '🗑️ <b>Очистить список</b><br><br>'
+            'Удаляет все файлы из списка обработки.<br>'
+            'Количество экземпляров для каждого файла сбрасывается.',
+        'Запустить обработку': '🚀 <b>Запустить обработку</b><br><br>'
+            'Начинает обработку выбранных BOM файлов с автоматической классификацией компонентов.<br><br>'
+            '<b>Процесс:</b><br>'
+            '1. Конвертация .doc файлов в .docx (если нужно)<br>'
+            '2. Парсинг BOM файлов<br>'
+            '3. Автоматическая классификация по базе данных<br>'
+            '4. Создание выходного Excel файла с категориями<br><br>'
+            '<b>Горячая клавиша:</b> Ctrl+R',
+        'Интерактивная классификация': '🎯 <b>Интерактивная классификация</b><br><br>'
+            'Открывает диалог для ручной классификации нераспределенных компонентов.<br><br>'
+            '<b>Использование:</b><br>'
+            '1. Выберите компонент из списка<br>'
+            '2. Выберите категорию<br>'
+            '3. Компонент будет добавлен в базу данных<br>'
+            '4. Повторите для всех нераспределенных компонентов',
+        'Сравнить файлы': '🔍 <b>Сравнить файлы</b><br><br>'
+            'Сравнивает два BOM файла и показывает различия.<br><br>'
+            '<b>Требования:</b><br>'
+            '• Оба файла должны быть уже обработаны (с категориями)<br>'
+            '• Если файлы не обработаны, появится предупреждение<br><br>'
+            'Результат покажет добавленные, удаленные и измененные компоненты.',
+        'Выбрать': '📁 <b>Выбрать файл</b><br><br>'
+            'Открывает диалог выбора файла для сохранения результата обработки.',
+    },
+    'QLineEdit': {
+        'Выходной файл': '📄 <b>Выходной файл</b><br><br>'
+            'Имя файла для сохранения результата обработки.<br><br>'
+            '<b>По умолчанию:</b><br>'
+            '• Для одного файла: {имя_файла}_categorized.xlsx<br>'
+            '• Для нескольких файлов: categorized.xlsx<br>'
+            '• Сохраняется в папке первого входного файла<br>'
+            '• Если файл существует, добавляется _1, _2 и т.д.',
+    },
+    'QListWidget': {
+        '': '📋 <b>Список файлов</b><br><br>'
+            'Список выбранных файлов для обработки.<br><br>'
+            '<b>Действия:</b><br>'
+            '• Выберите файл для изменения количества экземпляров<br>'
+            '• Двойной клик открывает диалог изменения количества<br>'
+            '• Файлы можно удалить через контекстное меню',
+    },
+    'QPlainTextEdit': {
+        'Лог выполнения': '📝 <b>Лог выполнения</b><br><br>'
+            'Отображает информацию о процессе обработки файлов.<br><br>'
+            '<b>Функции:</b><br>'
+            '• Показывает прогресс обработки<br>'
+            '• Отображает ошибки и предупреждения<br>'
+            '• Двойной клик открывает лог в текстовом редакторе<br>'
+            '• В экспертном режиме можно включить временные метки',
+    },
+    'QTextBrowser': {
+        '': '📖 <b>Текстовая область</b><br><br>'
+            'Область для отображения текстовой информации с поддержкой HTML и ссылок.',
+    },
+    'QLabel': {
+        '': '🏷️ <b>Метка</b><br><br>'
+            'Текстовая метка для отображения информации или подсказок.',
+    },
+}
+
+
+class _HelpKeyDeleteTable(dict):
+    """
+    Таблица для str.translate: удаляет эмодзи и знаки препинания
+
+    Сохраняются буквы, цифры, '_' и пробельные символы (как у [^\\w\\s]).
+    Решение для каждого символа вычисляется при первой встрече и запоминается.
+    """
+
+    def __missing__(self, code: int):
+        char = chr(code)
+        value = code if (char.isalnum() or char == '_' or char.isspace()) else None
+        self[code] = value
+        return value
+
+
+_HELP_KEY_DELETE_TABLE = _HelpKeyDeleteTable()
+
+
+def _normalize_help_key(text: str) -> str:
+    """Нормализует текст виджета для поиска справки: без эмодзи и знаков, в нижнем регистре"""
+    return text.translate(_HELP_KEY_DELETE_TABLE).strip().lower()
+
+
+# Справка с нормализованными ключами для поиска за O(1)
+# (значения - те же объекты строк из _HELP_MAP, тексты не дублируются)
+_HELP_MAP_NORMALIZED = {
+    widget_type: {_normalize_help_key(key): value for key, value in type_help.items()}
+    for widget_type, type_help in _HELP_MAP.items()
+}
+
+
+def _widget_tooltip(widget) -> str:
+    return widget.toolTip()
+
+
+def _widget_text(widget) -> str:
+    return widget.text()
+
+
+# Способ получения текста виджета по имени типа (для контекстной помощи):
+# у виджетов с text() берется текст, у остальных - подсказка
+_TEXT_GETTERS = {
+    'QPushButton': _widget_text,
+    'QToolButton': _widget_text,
+    'QCheckBox': _widget_text,
+    'QRadioButton': _widget_text,
+    'QLabel': _widget_text,
+    'QLineEdit': _widget_text,
+    'QAction': _widget_text,
+    'QTextEdit': _widget_tooltip,
+    'QTextBrowser': _widget_tooltip,
+    'QPlainTextEdit': _widget_tooltip,
+    'QListWidget': _widget_tooltip,
+    'QTableView': _widget_tooltip,
+    'QComboBox': _widget_tooltip,
+    'QSpinBox': _widget_tooltip,
+    'QMenu': _widget_tooltip,
+    'QMenuBar': _widget_tooltip,
+    'QWidget': _widget_tooltip,
+    'QFrame': _widget_tooltip,
+}
+
+
+def _get_widget_text(widget) -> str:
+    """Возвращает текст виджета для поиска справки"""
+    getter = _TEXT_GETTERS.get(type(widget).__name__)
+    if getter is not None:
+        return getter(widget)
+    # Неизвестный тип - одна проверка вместо цепочки hasattr
+    text = getattr(widget, 'text', None)
+    if text is not None:
+        return text()
+    tooltip = getattr(widget, 'toolTip', None)
+    return tooltip() if tooltip is not None else ""
+
+
+# Общая справка по F1, когда под курсором нет конкретного элемента
+_DEFAULT_HELP_HTML = (
+    "📖 <b>Контекстная помощь</b><br><br>"
+    "Наведите курсор на элемент интерфейса и нажмите <b>F1</b> для получения справки.<br><br>"
+    "Или выберите элемент и нажмите <b>F1</b> для получения подробной информации.<br><br>"
+    "<b>Доступные элементы с помощью:</b><br>"
+    "• Кнопки (Добавить файлы, Запустить обработку, и т.д.)<br>"
+    "• Поля ввода<br>"
+    "• Списки файлов<br>"
+    "• Область лога<br>"
+    "• Меню и пункты меню"
+)
+
+# Общая справка по типу виджета (если для конкретного элемента справки нет)
+_GENERAL_HELP = {
+    'QPushButton': '🔘 <b>Кнопка</b><br><br>Кнопка для выполнения действия. Нажмите для активации.',
+    'QLineEdit': '📝 <b>Поле ввода</b><br><br>Поле ввода текста. Введите значение или используйте кнопку "Выбрать..." для выбора файла.',
+    'QSpinBox': '🔢 <b>Числовое поле</b><br><br>Поле для ввода числового значения. Используйте стрелки или введите значение вручную.',
+    'QCheckBox': '☑️ <b>Флажок</b><br><br>Флажок для включения/выключения опции.',
+    'QListWidget': '📋 <b>Список</b><br><br>Список элементов. Выберите элемент для работы с ним.',
+    'QTextEdit': '📄 <b>Текстовое поле</b><br><br>Текстовое поле для отображения и редактирования информации.',
+    'QMenu': '📋 <b>Меню</b><br><br>Меню для доступа к функциям приложения.',
+    'QMenuBar': '📋 <b>Строка меню</b><br><br>Главное меню приложения с разделами: Файл, Вид, База данных, Помощь.',
+}
+
+
+# Статьи базы знаний (меню "Помощь" → "База знаний")
+_KNOWLEDGE_BASE = {
+    'обработка': {
+        'title': 'Обработка BOM файлов',
+        'content': '''
+<b>Как обработать BOM файлы:</b>
+1. Нажмите "➕ Добавить файлы" и выберите файлы (XLSX, DOCX, TXT)
+2. Укажите количество экземпляров для каждого файла (если нужно)
+3. Выберите выходной файл (по умолчанию сохраняется в папке первого файла)
+4. Нажмите "🚀 Запустить обработку"
+
+<b>Поддерживаемые форматы:</b>
+• Excel (.xlsx) - основной формат
+• Word (.docx, .doc) - автоматически конвертируется
+• Текст (.txt) - простой текстовый формат
+
+<b>Результат:</b>
+Создается Excel файл с листами по категориям компонентов.
+'''
+    },
+    'классификация': {
+        'title': 'Классификация компонентов',
+        'content': '''
+<b>Автоматическая классификация:</b>
+Компоненты автоматически классифицируются по базе данных.
+
+<b>Интерактивная классификация:</b>
+Если есть нераспределенные компоненты:
+1. После обработки откроется диалог
+2. Выберите компонент из списка
+3. Выберите категорию
+4. Компонент будет добавлен в базу данных
+
+<b>Категории:</b>
+• Резисторы, Конденсаторы, Индуктивности
+• Микросхемы, Диоды, Транзисторы
+• Разъемы, Механика, Прочее
+'''
+    },
+    'база данных': {
+        'title': 'База данных компонентов',
+        'content': '''
+<b>Управление базой данных:</b>
+• <b>Статистика</b> - просмотр информации о БД
+• <b>Экспорт в Excel</b> - сохранение БД для редактирования
+• <b>Импорт из Excel</b> - загрузка БД из файла
+• <b>Резервное копирование</b> - создание бэкапа
+• <b>Посмотреть базу</b> - просмотр истории изменений
+• <b>Очистить базу</b> - удаление всех компонентов
+
+<b>Версионирование:</b>
+База данных использует версионирование X.Y:
+• X увеличивается при импорте из файлов
+• Y увеличивается при ручном добавлении
+'''
+    },
+    'сравнение': {
+        'title': 'Сравнение BOM файлов',
+        'content': '''
+<b>Как сравнить файлы:</b>
+1. Выберите первый файл (базовый)
+2. Выберите второй файл (новый)
+3. Укажите файл результата
+4. Нажмите "⚡ Сравнить файлы"
+
+<b>Результат:</b>
+Создается Excel файл с листами:
+• "Добавлено" - новые компоненты
+• "Удалено" - удаленные компоненты
+• "Изменено" - измененные компоненты
+'''
+    },
+    'масштаб': {
+        'title': 'Масштабирование интерфейса',
+        'content': '''
+<b>Изменение масштаба:</b>
+• Меню "Вид" → "Масштабирование интерфейса"
+• Горячие клавиши: Ctrl+Plus, Ctrl+Minus, Ctrl+0
+
+<b>Доступные масштабы:</b>
+70%, 80%, 90%, 100%, 110%, 125%
+
+Масштаб сохраняется в настройках.
+'''
+    },
+    'режимы': {
+        'title': 'Режимы работы',
+        'content': '''
+<b>Простой режим:</b>
+Упрощенный интерфейс (по умолчанию).
+Скрыты: сравнение файлов, лог, меню базы данных.
+
+<b>Расширенный режим:</b>
+Все функции доступны.
+
+<b>Экспертный режим:</b>
+Дополнительные настройки:
+• Временные метки в логе
+• Автоматическое открытие папки результата
+'''
+    },
+}
+
+# Тексты статей базы знаний в нижнем регистре (чтобы не пересчитывать при каждом поиске)
+_KB_LOWER = {
+    key: (key.lower(), article['title'].lower(), article['content'].lower())
+    for key, article in _KNOWLEDGE_BASE.items()
+}
+
+# Готовые HTML-фрагменты статей базы знаний
+_KB_ARTICLE_HTML = {
+    key: f'<h3>{article["title"]}</h3><p>{article["content"]}</p><hr>'
+    for key, article in _KNOWLEDGE_BASE.items()
+}
+
+
+# Руководство по Drag & Drop (HTML для диалога справки)
+_DRAGDROP_HELP_HTML = """
+<h1 style="color: #89b4fa;">🎯 Улучшенный Drag & Drop</h1>
+
+<h2 style="color: #94e2d5;">Как включить</h2>
+<ol>
+<li>Переключитесь в <b>Экспертный режим</b><br>
+    (Вид → Режим работы → Экспертный режим)</li>
+<li>В секции <b>Экспертные инструменты</b> найдите чекбокс:<br>
+    <i>🎯 Улучшенный Drag & Drop</i></li>
+<li>Установите галочку - функция активируется мгновенно!</li>
+</ol>
+
+<h2 style="color: #94e2d5;">Основные возможности</h2>
+
+<h3 style="color: #f9e2af;">📁 Перетаскивание из проводника</h3>
+<ul>
+<li>Откройте папку с файлами в проводнике Windows</li>
+<li>Выделите нужные файлы (.xlsx, .docx, .txt)</li>
+<li>Перетащите их в список <b>Входные файлы</b></li>
+<li>Зона подсветится синей рамкой при перетаскивании</li>
+</ul>
+
+<h3 style="color: #f9e2af;">🔄 Изменение порядка файлов</h3>
+<ul>
+<li>Зажмите левую кнопку мыши на файле в списке</li>
+<li>Перетащите файл на нужную позицию</li>
+<li>Отпустите кнопку мыши</li>
+<li>Порядок обработки соответствует порядку в списке</li>
+</ul>
+
+<h3 style="color: #f9e2af;">🖱️ Контекстное меню (ПКМ)</h3>
+<p>Щелкните <b>правой кнопкой мыши</b> на любом файле в списке:</p>
+<ul>
+<li><b>📄 Открыть файл</b> - открывает файл в Excel/Word/Notepad</li>
+<li><b>📁 Показать в проводнике</b> - открывает папку и выделяет файл</li>
+<li><b>📋 Копировать путь</b> - копирует полный путь к файлу</li>
+<li><b>🗑️ Удалить из списка</b> - удаляет файл из списка (не физически)</li>
+</ul>
+
+<h2 style="color: #94e2d5;">Примеры использования</h2>
+
+<h3 style="color: #cba6f7;">Пример 1: Быстрое добавление файлов</h3>
+<p style="margin-left: 20px;">
+1. Откройте папку с BOM-файлами<br>
+2. Выделите все нужные файлы (Ctrl+Click)<br>
+3. Перетащите в окно программы<br>
+4. Готово! Все файлы добавлены
+</p>
+
+<h3 style="color: #cba6f7;">Пример 2: Изменение приоритета</h3>
+<p style="margin-left: 20px;">
+Нужно чтобы "БОМ_основной.xlsx" обработался первым:<br>
+• Перетащите его в начало списка<br>
+• Файлы обрабатываются сверху вниз
+</p>
+
+<h3 style="color: #cba6f7;">Пример 3: Быстрое открытие файла</h3>
+<p style="margin-left: 20px;">
+• ПКМ на файле → "📄 Открыть файл"<br>
+• Файл откроется в Excel/Word<br>
+• Удобно для быстрой проверки
+</p>
+
+<h3 style="color: #cba6f7;">Пример 4: Отправка пути коллеге</h3>
+<p style="margin-left: 20px;">
+• ПКМ на файле → "📋 Копировать путь"<br>
+• Ctrl+V в мессенджер/email<br>
+• Коллега получит точный путь к файлу
+</p>
+
+<h2 style="color: #94e2d5;">Горячие клавиши</h2>
+<table style="border-collapse: collapse; width: 100%;">
+<tr style="background-color: #313244;">
+    <th style="padding: 8px; text-align: left; border: 1px solid #45475a;">Действие</th>
+    <th style="padding: 8px; text-align: left; border: 1px solid #45475a;">Клавиша</th>
+</tr>
+<tr>
+    <td style="padding: 8px; border: 1px solid #45475a;">Выделить все файлы</td>
+    <td style="padding: 8px; border: 1px solid #45475a;"><b>Ctrl+A</b></td>
+</tr>
+<tr style="background-color: #1e1e2e;">
+    <td style="padding: 8px; border: 1px solid #45475a;">Множественный выбор</td>
+    <td style="padding: 8px; border: 1px solid #45475a;"><b>Ctrl+Click</b></td>
+</tr>
+<tr>
+    <td style="padding: 8px; border: 1px solid #45475a;">Диапазон выбора</td>
+    <td style="padding: 8px; border: 1px solid #45475a;"><b>Shift+Click</b></td>
+</tr>
+<tr style="background-color: #1e1e2e;">
+    <td style="padding: 8px; border: 1px solid #45475a;">Удалить выбранное</td>
+    <td style="padding: 8px; border: 1px solid #45475a;"><b>Delete</b></td>
+</tr>
+</table>
+
+<h2 style="color: #94e2d5;">⚠️ Важные замечания</h2>
+<ul>
+<li>Поддерживаются только файлы: .xlsx, .docx, .doc, .txt</li>
+<li>При перетаскивании из проводника файлы не перемещаются - добавляется только ссылка</li>
+<li>Для отключения функции требуется перезапуск программы</li>
+<li>Рекомендуется не добавлять более 100 файлов одновременно</li>
+</ul>
+
+<h2 style="color: #94e2d5;">💡 Советы</h2>
+<ul>
+<li>Используйте ПКМ → "Показать в проводнике" для быстрого доступа к папке</li>
+<li>Копирование пути удобно для отправки локации файла другим пользователям</li>
+<li>Изменяйте порядок файлов для контроля последовательности обработки</li>
+<li>Визуальная подсветка показывает что файлы можно сбросить в эту область</li>
+</ul>
+
+<hr style="border: 1px solid #45475a; margin: 20px 0;">
+
+<p style="text-align: center; color: #6c7086;">
+<i>Экспериментальная функция в ветке experimental/new-feature</i><br>
+Полная документация: <b>DRAG_DROP_README.md</b>
+</p>
+"""
+
+
 class BOMCategorizerMainWindow(QMainWindow):
     """Главное окно приложения BOM Categorizer на PySide6"""
 
@@ -180,6 +1101,35 @@ class BOMCategorizerMainWindow(QMainWindow):
         self.selected_file_index: Optional[int] = None
         self.processing_dialog_ref = None  # Ссылка на диалог обработки (для плавного перехода)
         self.last_input_file = None  # Последний добавленный входной файл (для истории БД)
+        self._source_search_dirs: Optional[tuple] = None  # Кэш папок поиска файлов-источников
+        self._font_cache: Dict[tuple, QFont] = {}  # Кэш шрифтов диалогов {(семейство, размер, жирный): QFont}
+        self._db_view_dialog: Optional['DatabaseViewDialog'] = None  # Переиспользуемый диалог просмотра БД
+        self._about_dialog: Optional[QDialog] = None  # Переиспользуемый диалог "О программе"
+        self._size_menu: Optional[QMenu] = None  # Меню размеров окна (создается при первом открытии)
+        self._knowledge_base_dialog: Optional[QDialog] = None  # Переиспользуемый диалог базы знаний
+        self._dragdrop_help_dialog: Optional[QDialog] = None  # Переиспользуемый диалог справки Drag & Drop
+        self._system_info_dialog: Optional[QDialog] = None  # Переиспользуемый диалог системной информации
+        self._system_info_view: Optional[QTextBrowser] = None
+        self._system_info_html = ""
+        self.database_worker: Optional[DatabaseTaskWorker] = None  # Фоновая операция с БД (экспорт/импорт/бэкап)
+        self.file_check_worker: Optional[FileCheckWorker] = None  # Проверка файлов большого Drag & Drop
+        self.database_info_worker: Optional[DatabaseTaskWorker] = None  # Загрузка статистики БД для футера
+        self._database_task_state = None  # (индикатор, обработчик результата) текущей операции с БД
+        self._db_tooltip_source = None  # stats, по которым построен текущий tooltip БД
+
+        # Метка размера окна обновляется после окончания перетаскивания, а не на каждый resizeEvent
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_size_label)
+
+        # Масштаб применяется после паузы в нажатиях Ctrl+=/Ctrl+-, а не на каждое нажатие
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(80)
+        self._zoom_timer.timeout.connect(self.apply_scale_factor)
+        self._menubar_style = ""  # Последний примененный stylesheet строки меню
+        self._ai_settings = None  # Настройки AI классификатора (загружаются при первом обращении)
 
         # Сравнение файлов
         self.compare_file1 = ""
@@ -198,7 +1148,7 @@ class BOMCategorizerMainWindow(QMainWindow):
         # Настройки отображения
         # На macOS используем размеры сопоставимые со стандартными приложениями
         # ВНИМАНИЕ: Глобальный шрифт уже установлен в main(), здесь только для локального использования
-        if platform.system() == 'Darwin':  # macOS
+        if _IS_MAC:  # macOS
             # Проверяем, есть ли Retina дисплей (devicePixelRatio >= 2)
             try:
                 from PySide6.QtGui import QGuiApplication
@@ -216,11 +1166,12 @@ class BOMCategorizerMainWindow(QMainWindow):
             self.base_font_size = 12
         
         self.scale_levels: List[float] = [0.7, 0.8, 0.9, 1.0, 1.1, 1.25, 1.5]
+        self._scale_index: Dict[float, int] = {factor: i for i, factor in enumerate(self.scale_levels)}
         ui_settings = self.cfg.get("ui", {})
         # Дефолтный scale_factor: 1.0 для всех платформ (можно настроить в меню)
-        default_scale = 1.0 if platform.system() == 'Darwin' else 0.8
+        default_scale = 1.0 if _IS_MAC else 0.8
         self.scale_factor = ui_settings.get("scale_factor", default_scale)
-        if self.scale_factor not in self.scale_levels:
+        if self.scale_factor not in self._scale_index:
             # Если значение некорректное, используем дефолт для ОС
             self.scale_factor = default_scale
 
@@ -256,8 +1207,14 @@ class BOMCategorizerMainWindow(QMainWindow):
         self.view_mode_actions: Dict[str, QAction] = {}
         self.db_menu: Optional[QMenu] = None
         self.mode_label: Optional[QLabel] = None
+        # Флажки экспертной секции создаются при первом переходе в экспертный режим
+        self.combine_check: Optional[QCheckBox] = None
         self.timestamp_checkbox: Optional[QCheckBox] = None
         self.auto_open_output_checkbox: Optional[QCheckBox] = None
+        self.enhanced_dragdrop_checkbox: Optional[QCheckBox] = None
+        self.auto_export_pdf_checkbox: Optional[QCheckBox] = None
+        self.ai_classifier_checkbox: Optional[QCheckBox] = None
+        self.ai_auto_classify_checkbox: Optional[QCheckBox] = None
 
         # Применяем стили
         self._setup_styles()
@@ -302,25 +1259,22 @@ class BOMCategorizerMainWindow(QMainWindow):
         
         # На macOS удаляем все font-size из стилей, чтобы использовались
         # программно установленные размеры (для правильной работы на Retina)
-        if platform.system() == 'Darwin':  # macOS
+        if _IS_MAC:  # macOS
             # Удаляем все строки с font-size из CSS
             import re
             # Удаляем font-size: XXpt; из стилей
             theme_style = re.sub(r'\s*font-size:\s*\d+pt;', '', theme_style)
         
-        self.setStyleSheet(theme_style)
+        self.setStyleSheet(theme_style + _HISTORY_TABLE_QSS + _STATUS_LABELS_QSS + _EXPORT_PDF_BUTTON_QSS)
 
     def toggle_theme(self):
         """Переключает между темной и светлой темой"""
         # Переключаем тему
         self.current_theme = "light" if self.current_theme == "dark" else "dark"
         
-        # Применяем новую тему
+        # Применяем новую тему (выбор не сохраняется - тема берется из config_qt.json)
         self.apply_theme()
         
-        # Сохраняем выбор в конфиг
-        self.save_theme_preference()
-        
         # Показываем уведомление
         theme_name = "Темная" if self.current_theme == "dark" else "Светлая"
         QMessageBox.information(
@@ -329,10 +1283,6 @@ class BOMCategorizerMainWindow(QMainWindow):
             f"{theme_name} тема применена успешно!"
         )
 
-    def save_theme_preference(self):
-        """Сохраняет выбор темы в конфигурационный файл"""
-        self.save_ui_preferences()
-
     def _create_menu(self):
         """Создает меню приложения"""
         menubar = self.menuBar()
@@ -705,15 +1655,23 @@ class BOMCategorizerMainWindow(QMainWindow):
         file_path = text.split(" (x")[0]
 
         if file_path in self.input_files:
-            self.input_files[file_path] = self.multiplier_spin.value()
-            self.update_listbox()
+            count = self.multiplier_spin.value()
+            self.input_files[file_path] = count
+            # Меняем только текст выбранной строки - список не перестраивается, выбор сохраняется
+            item.setText(f"{file_path} (x{count})")
 
     def update_listbox(self):
         """Обновление списка файлов"""
-        self.files_list.clear()
-        for file_path, count in self.input_files.items():
-            filename = os.path.basename(file_path)
-            self.files_list.addItem(f"{file_path} (x{count})")
+        # Заполняем список одним вызовом: без перерисовки и сигналов выбора на каждый элемент
+        files_list = self.files_list
+        files_list.setUpdatesEnabled(False)
+        blocked = files_list.blockSignals(True)
+        try:
+            files_list.clear()
+            files_list.addItems([f"{file_path} (x{count})" for file_path, count in self.input_files.items()])
+        finally:
+            files_list.blockSignals(blocked)
+            files_list.setUpdatesEnabled(True)
 
     def update_output_filename(self):
         """Автоматическое обновление имени выходного файла"""
@@ -835,7 +1793,8 @@ class BOMCategorizerMainWindow(QMainWindow):
         
         args.extend(["--xlsx", output_file])
         
-        if self.combine_check.isChecked():
+        # self.combine синхронизирован с флажком (флажка нет, пока секция не построена)
+        if self.combine:
             args.append("--combine")
         
         td = self.txt_entry.text().strip()
@@ -928,7 +1887,7 @@ class BOMCategorizerMainWindow(QMainWindow):
             True если конвертация успешна
         """
         # На macOS/Linux используем LibreOffice
-        if platform.system() != 'Windows':
+        if not _IS_WINDOWS:
             return self._convert_doc_with_libreoffice(doc_files)
         
         # На Windows используем MS Word
@@ -1505,9 +2464,9 @@ class BOMCategorizerMainWindow(QMainWindow):
             if reply == QMessageBox.Yes and os.path.exists(output_file):
                 try:
                     # Открываем файл в системном приложении
-                    if platform.system() == 'Windows':
+                    if _IS_WINDOWS:
                         os.startfile(output_file)
-                    elif platform.system() == 'Darwin':  # macOS
+                    elif _IS_MAC:  # macOS
                         subprocess.Popen(['open', output_file])
                     else:  # Linux
                         subprocess.Popen(['xdg-open', output_file])
@@ -1601,9 +2560,9 @@ class BOMCategorizerMainWindow(QMainWindow):
                 )
                 
                 if reply == QMessageBox.Yes and os.path.exists(output_file):
-                    if platform.system() == 'Windows':
+                    if _IS_WINDOWS:
                         os.startfile(output_file)
-                    elif platform.system() == 'Darwin':
+                    elif _IS_MAC:
                         subprocess.Popen(['open', output_file])
                     else:
                         subprocess.Popen(['xdg-open', output_file])
@@ -1643,6 +2602,18 @@ class BOMCategorizerMainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Не удалось открыть папку установки:\n{str(e)}")
 
+    def on_db_location_click(self, event):
+        """Клик по метке расположения в футере (режим разработки) - папка базы данных"""
+        self.on_open_db_folder()
+
+    def on_install_location_click(self, event):
+        """Клик по метке расположения в футере (установленная версия) - папка установки"""
+        self.on_open_install_folder()
+
+    def on_db_info_label_click(self, event):
+        """Клик по информации о БД в футере - просмотр базы данных"""
+        self.on_view_database()
+
     def on_replace_database(self):
         """Заменить текущую базу данных на другую из JSON файла"""
         try:
@@ -1748,6 +2719,7 @@ class BOMCategorizerMainWindow(QMainWindow):
             # Копируем новую базу данных
             import shutil
             shutil.copy2(file_path, current_db_path)
+            invalidate_database_stats_cache()
             
             # Проверяем что копирование прошло успешно
             new_stats = get_database_stats()
@@ -2049,10 +3021,40 @@ class BOMCategorizerMainWindow(QMainWindow):
         except Exception as e:
             self.log_text.append(f"⚠️ Ошибка сохранения настроек: {e}\n")
 
+    @staticmethod
+    def _cached_stats() -> tuple:
+        """
+        Возвращает (stats, history) базы данных
+
+        Обе функции берут данные из общего кэша component_database: файл БД
+        перечитывается только после его изменения.
+        """
+        return get_database_stats(), get_database_history()
+
+    def load_database_info_async(self):
+        """Загружает статистику БД для футера в фоновом потоке (не задерживая показ окна)"""
+        if self.database_info_worker is not None and self.database_info_worker.isRunning():
+            return
+
+        def load_task():
+            # Чтение файла заполняет кэш component_database - футер возьмет данные из него
+            return self._cached_stats()
+
+        self.database_info_worker = DatabaseTaskWorker(load_task)
+        self.database_info_worker.finished.connect(self.on_database_info_loaded)
+        self.database_info_worker.start()
+
+    def on_database_info_loaded(self, success: bool, result, error_message: str):
+        """Заполняет футер загруженной статистикой БД (в GUI потоке)"""
+        if not success:
+            self.db_info_label.setText("БД: Не загружена")
+            return
+        self.update_database_info()
+
     def update_database_info(self):
         """Обновляет информацию о базе данных в футере"""
         try:
-            stats = get_database_stats()
+            stats, _ = self._cached_stats()
             metadata = stats.get('metadata', {})
             db_version = metadata.get('version', 'N/A')
             last_updated = metadata.get('last_updated', '')
@@ -2076,7 +3078,7 @@ class BOMCategorizerMainWindow(QMainWindow):
             # Устанавливаем курсор и обработчик клика (если еще не установлены)
             if not self.db_info_label.cursor().shape() == Qt.PointingHandCursor:
                 self.db_info_label.setCursor(Qt.PointingHandCursor)
-                self.db_info_label.mousePressEvent = lambda event: self.on_view_database()
+                self.db_info_label.mousePressEvent = self.on_db_info_label_click
         except Exception as e:
             self.db_info_label.setText("БД: Ошибка загрузки")
             print(f"Ошибка обновления информации БД: {e}")
@@ -2084,11 +3086,11 @@ class BOMCategorizerMainWindow(QMainWindow):
     def update_database_tooltip(self):
         """Обновляет tooltip для информации о базе данных"""
         try:
-            from .component_database import get_database_history
-            
-            stats = get_database_stats()
+            stats, history = self._cached_stats()
+            # Tooltip перестраивается только после перечитывания БД (новый объект в кэше)
+            if stats is self._db_tooltip_source:
+                return
             metadata = stats.get('metadata', {})
-            history = get_database_history()
             
             # Формируем tooltip
             tooltip_lines = []
@@ -2106,7 +3108,7 @@ class BOMCategorizerMainWindow(QMainWindow):
                 tooltip_lines.append(f"📋 Структура по категориям:")
                 tooltip_lines.append(f"─────────────────────────────")
                 # Сортируем по количеству (от большего к меньшему)
-                sorted_categories = sorted(by_category.items(), key=lambda x: x[1], reverse=True)
+                sorted_categories = sorted(by_category.items(), key=itemgetter(1), reverse=True)
                 for cat_key, count in sorted_categories:
                     cat_name = category_names.get(cat_key, cat_key)
                     tooltip_lines.append(f"  {cat_name}: {count}")
@@ -2160,6 +3162,7 @@ class BOMCategorizerMainWindow(QMainWindow):
                 tooltip_lines.append(f"История изменений пуста")
             
             self.db_info_label.setToolTip('\n'.join(tooltip_lines))
+            self._db_tooltip_source = stats
             
         except Exception as e:
             self.db_info_label.setToolTip(f"Информация о БД недоступна: {e}")
@@ -2174,6 +3177,10 @@ class BOMCategorizerMainWindow(QMainWindow):
             else:
                 self.log_text.append("❌ Авторизация отменена")
 
+    def on_developer_label_double_click(self, event):
+        """Обработчик mouseDoubleClickEvent метки разработчика"""
+        self.on_developer_double_click()
+
     def on_log_double_click(self, event):
         """Обработчик двойного клика на логе - открывает лог в текстовом редакторе"""
         try:
@@ -2195,9 +3202,9 @@ class BOMCategorizerMainWindow(QMainWindow):
                 temp_file = f.name
             
             # Открываем в системном текстовом редакторе
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 os.startfile(temp_file)
-            elif platform.system() == 'Darwin':  # macOS
+            elif _IS_MAC:  # macOS
                 subprocess.Popen(['open', temp_file])
             else:  # Linux
                 subprocess.Popen(['xdg-open', temp_file])
@@ -2215,13 +3222,22 @@ class BOMCategorizerMainWindow(QMainWindow):
         """Показать меню размеров окна"""
         from PySide6.QtCore import QPoint
         
-        menu = QMenu(self)
+        # Меню создается один раз и переиспользуется
+        if self._size_menu is None:
+            self._size_menu = self._create_size_menu()
+        menu = self._size_menu
         
         # Применяем шрифт меню с учётом scale_factor (та же логика что для основных меню)
         menu_scale = max(self.scale_factor + 0.2, 0.9)
         menu_font_size = max(7, int(round(9 * menu_scale)))
-        menu_font = QFont(get_system_font(), menu_font_size)
-        menu.setFont(menu_font)
+        menu.setFont(self._font(menu_font_size))
+        
+        # Показываем меню у метки размера окна
+        menu.exec(self.size_label.mapToGlobal(QPoint(0, self.size_label.height())))
+
+    def _create_size_menu(self) -> QMenu:
+        """Создает меню предустановленных размеров окна"""
+        menu = QMenu(self)
         
         # Предустановленные размеры
         sizes = [
@@ -2233,19 +3249,27 @@ class BOMCategorizerMainWindow(QMainWindow):
             ("HD (1280×720)", 1280, 720),
         ]
         
+        # Размер хранится в data() действия, все действия обрабатывает один слот
         for label, w, h in sizes:
-            action = QAction(label, self)
-            action.triggered.connect(lambda checked=False, width=w, height=h: self.set_window_size(width, height))
+            action = QAction(label, menu)
+            action.setData((w, h))
+            action.triggered.connect(self._on_size_chosen)
             menu.addAction(action)
         
         menu.addSeparator()
         
-        save_action = QAction("📌 Сохранить текущий размер", self)
+        save_action = QAction("📌 Сохранить текущий размер", menu)
         save_action.triggered.connect(self.save_current_window_size)
         menu.addAction(save_action)
         
-        # Показываем меню у метки размера окна
-        menu.exec(self.size_label.mapToGlobal(QPoint(0, self.size_label.height())))
+        return menu
+
+    def _on_size_chosen(self):
+        """Применяет размер окна, выбранный в меню размеров"""
+        action = self.sender()
+        if action is not None:
+            width, height = action.data()
+            self.set_window_size(width, height)
     
     def set_window_size(self, width: int, height: int):
         """Устанавливает размер окна"""
@@ -2346,8 +3370,14 @@ class BOMCategorizerMainWindow(QMainWindow):
     def resizeEvent(self, event):
         """Обработка изменения размера окна"""
         super().resizeEvent(event)
+        self._resize_timer.start()
+
+    def _apply_size_label(self):
+        """Обновляет метку размера окна (вызывается таймером после изменения размера)"""
         if hasattr(self, 'size_label'):
-            self.size_label.setText(f"📐 {self.width()}×{self.height()}")
+            new_text = f"📐 {self.width()}×{self.height()}"
+            if self.size_label.text() != new_text:
+                self.size_label.setText(new_text)
     
     def closeEvent(self, event):
         """Обработка закрытия окна - настройки НЕ сохраняются"""
@@ -2362,6 +3392,26 @@ class BOMCategorizerMainWindow(QMainWindow):
         """Показывает статистику базы данных"""
         self.show_database_stats()
 
+    def _font(self, point_size: int, bold: bool = False, family: Optional[str] = None) -> QFont:
+        """
+        Возвращает шрифт для диалогов из кэша (создает при первом обращении)
+
+        Args:
+            point_size: Размер шрифта в пунктах
+            bold: Жирное начертание
+            family: Семейство шрифта (по умолчанию - системный шрифт)
+
+        Returns:
+            QFont: Кэшированный шрифт (не изменять на месте)
+        """
+        key = (family or get_system_font(), point_size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = QFont(key[0], point_size)
+            font.setBold(bold)
+            self._font_cache[key] = font
+        return font
+
     def show_database_stats(self):
         """Показывает статистику базы данных"""
         try:
@@ -2373,7 +3423,7 @@ class BOMCategorizerMainWindow(QMainWindow):
             by_category = stats.get("by_category", {})
             category_names = stats.get("category_names", {})
             
-            stats_text = f"""📊 СТАТИСТИКА БАЗЫ ДАННЫХ
+            lines = [f"""📊 СТАТИСТИКА БАЗЫ ДАННЫХ
 
 📁 Расположение:
 {db_path}
@@ -2384,16 +3434,17 @@ class BOMCategorizerMainWindow(QMainWindow):
 • Обновлена: {metadata.get('last_updated', 'N/A')}
 • Всего компонентов: {metadata.get('total_components', 0)}
 
-📦 Распределение по категориям:
-"""
+📦 Распределение по категориям:"""]
             
             # Добавляем статистику по категориям
             if by_category:
-                for cat_id, count in sorted(by_category.items(), key=lambda x: x[1], reverse=True):
-                    cat_name = category_names.get(cat_id, cat_id)
-                    stats_text += f"• {cat_name}: {count}\n"
+                lines.extend(
+                    f"• {category_names.get(cat_id, cat_id)}: {count}"
+                    for cat_id, count in sorted(by_category.items(), key=itemgetter(1), reverse=True)
+                )
             else:
-                stats_text += "• Нет данных\n"
+                lines.append("• Нет данных")
+            stats_text = "\n".join(lines) + "\n"
             
             # Создаем диалог
             dialog = QDialog(self)
@@ -2402,21 +3453,18 @@ class BOMCategorizerMainWindow(QMainWindow):
             
             layout = QVBoxLayout()
             
-            # Текстовое поле с прокруткой
-            text_widget = QTextEdit()
+            # Текстовое поле с прокруткой (QPlainTextEdit - без разметки rich text)
+            text_widget = QPlainTextEdit()
             text_widget.setReadOnly(True)
             text_widget.setPlainText(stats_text)
             # Крупный фиксированный шрифт для читаемости
-            stats_font = QFont("Menlo" if sys.platform == "darwin" else "Consolas" if sys.platform == "win32" else "Monospace")
-            stats_font.setPointSize(14)
+            stats_font = self._font(14, family="Menlo" if sys.platform == "darwin" else "Consolas" if sys.platform == "win32" else "Monospace")
             text_widget.setFont(stats_font)
             layout.addWidget(text_widget)
             
             # Кнопка закрытия
             close_btn = QPushButton("Закрыть")
-            button_font = QFont()
-            button_font.setPointSize(12)
-            close_btn.setFont(button_font)
+            close_btn.setFont(self._font(12))
             close_btn.clicked.connect(dialog.accept)
             layout.addWidget(close_btn)
             
@@ -2429,254 +3477,22 @@ class BOMCategorizerMainWindow(QMainWindow):
                 "Ошибка",
                 f"Не удалось показать статистику базы данных:\n{str(e)}"
             )
-
-    def on_view_database(self):
-        """Показывает содержимое базы данных с историей формирования"""
-        try:
-            from .component_database import load_component_database
-            
-            # Загружаем базу данных
-            db = load_component_database()
-            stats = get_database_stats()
-            history = get_database_history()
-            metadata = stats.get('metadata', {})
-
-            current_hash = metadata.get('current_hash', '') or ''
-            if current_hash:
-                formatted_hash = ' '.join(current_hash[i:i+16] for i in range(0, len(current_hash), 16))
-            else:
-                formatted_hash = '—'
-            previous_hash = metadata.get('previous_hash', '') or ''
-            if previous_hash:
-                formatted_prev_hash = ' '.join(previous_hash[i:i+16] for i in range(0, len(previous_hash), 16))
-            else:
-                formatted_prev_hash = '—'
-
-            # Создаем диалог
-            dialog = QDialog(self)
-            dialog.setWindowTitle("👁️ Просмотр базы данных")
-            dialog.resize(900, 700)
-
-            layout = QVBoxLayout()
-
-            # Информация о базе данных
-            info_label = QLabel()
-            info_label.setProperty("class", "bold")
-            
-            # Применяем крупный шрифт для читаемости (базовый 14pt)
-            info_font_size = max(11, int(14 * self.scale_factor))
-            info_label.setFont(QFont(get_system_font(), info_font_size))
-            
-            info_text = f"""
-            <h3>📊 Информация о базе данных</h3>
-            <p><b>Версия:</b> {metadata.get('version', 'N/A')}</p>
-            <p><b>Последнее обновление:</b> {metadata.get('last_updated', 'N/A')}</p>
-            <p><b>Всего компонентов:</b> {stats.get('total', 0)}</p>
-            <p><b>Путь:</b> {get_database_path()}</p>
-            <p><b>Текущий хэш:</b> <code>{formatted_hash}</code></p>
-            <p><b>Предыдущий хэш:</b> <code>{formatted_prev_hash}</code></p>
-            """
-            info_label.setText(info_text)
-            layout.addWidget(info_label)
-
-            # История формирования
-            history_group = QGroupBox("📜 История формирования базы данных")
-            history_layout = QVBoxLayout()
-            
-            # Подсказка
-            hint_label = QLabel("💡 Дважды кликните на строку с файлом-источником, чтобы открыть его в проводнике")
-            hint_font_size = max(11, int(14 * self.scale_factor))
-            hint_label.setFont(QFont(get_system_font(), hint_font_size))
-            hint_label.setStyleSheet("color: #89b4fa; font-style: italic; padding: 5px;")
-            history_layout.addWidget(hint_label)
-
-            if history:
-                # Создаем таблицу для истории
-                history_table = QTableWidget()
-                history_table.setColumnCount(5)
-                history_table.setHorizontalHeaderLabels(["Версия", "Дата/Время", "Действие", "Источник", "Добавлено"])
-                
-                # Применяем крупный шрифт к таблице для читаемости (базовый 14pt)
-                # Для Windows уменьшаем на 3 пункта (было 2, теперь еще на 1 меньше)
-                base_font_size = 14
-                if platform.system() == 'Windows':
-                    base_font_size = 11  # Уменьшаем на 3 пункта для Windows
-                table_font_size = max(10, int(base_font_size * self.scale_factor))
-                table_font = QFont(get_system_font(), table_font_size)
-                history_table.setFont(table_font)
-                # Заголовки таблицы чуть крупнее и жирные
-                header_font = QFont(get_system_font(), table_font_size + 2)
-                header_font.setBold(True)
-                history_table.horizontalHeader().setFont(header_font)
-                
-                history_table.horizontalHeader().setStretchLastSection(False)
-                history_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-                history_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-                history_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-                history_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
-                history_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-                history_table.horizontalHeader().setHighlightSections(False)
-                history_table.horizontalHeader().setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-
-                history_table.verticalHeader().setVisible(False)
-                # Увеличенная высота строк для крупных шрифтов (базовая 40px)
-                row_height = max(36, int(40 * self.scale_factor))
-                history_table.verticalHeader().setDefaultSectionSize(row_height)
-                history_table.setAlternatingRowColors(True)
-                history_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-                history_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-                history_table.setSelectionMode(QAbstractItemView.SingleSelection)
-                history_table.setFocusPolicy(Qt.NoFocus)
-                history_table.setWordWrap(False)
-                history_table.setShowGrid(False)
-                history_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-                history_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
-                history_table.setCursor(Qt.PointingHandCursor)  # Курсор-указатель для подсказки о клике
-                history_table.setStyleSheet("""
-                    QTableWidget {
-                        background-color: #1f2335;
-                        alternate-background-color: #262a3d;
-                        color: #cdd6f4;
-                        border: 1px solid #2e3247;
-                        gridline-color: #2e3247;
-                    }
-                    QHeaderView::section {
-                        background-color: #313244;
-                        color: #f5e0dc;
-                        padding: 6px 8px;
-                        border: none;
-                        font-weight: 600;
-                    }
-                    QTableWidget::item {
-                        padding: 4px 6px;
-                    }
-                    QTableWidget::item:selected {
-                        background-color: #3b4376;
-                        color: #f8faff;
-                    }
-                """)
-
-                # Маппинг действий на русские названия
-                action_names = {
-                    "initial_creation": "Создание БД",
-                    "conversion_from_old_format": "Конвертация из старого формата",
-                    "manual_add": "Ручное добавление",
-                    "import_from_file": "Импорт из файла",
-                    "import_from_excel": "Импорт из Excel",
-                    "update": "Обновление",
-                    "database_cleared": "Очистка БД",
-                    "manual_version_change": "Смена версии"
-                }
-
-                # Заполняем таблицу
-                history_table.setRowCount(len(history))
-                for i, entry in enumerate(history):
-                    version_item = QTableWidgetItem(str(entry.get('version', 'N/A')))
-                    version_item.setTextAlignment(Qt.AlignCenter)
-                    timestamp_item = QTableWidgetItem(entry.get('timestamp', ''))
-                    timestamp_item.setTextAlignment(Qt.AlignCenter)
-                    action = action_names.get(entry.get('action', ''), entry.get('action', ''))
-                    action_item = QTableWidgetItem(action)
-                    source_value = entry.get('source', '-')
-                    source_item = QTableWidgetItem(source_value)
-                    source_item.setToolTip(source_value)
-                    added_item = QTableWidgetItem(str(entry.get('components_added', 0)))
-                    added_item.setTextAlignment(Qt.AlignCenter)
-
-                    history_table.setItem(i, 0, version_item)
-                    history_table.setItem(i, 1, timestamp_item)
-                    history_table.setItem(i, 2, action_item)
-                    history_table.setItem(i, 3, source_item)
-                    history_table.setItem(i, 4, added_item)
-
-                # Обработчик двойного клика для открытия файла-источника в проводнике
-                def open_source_file(index):
-                    row = index.row()
-                    source_item = history_table.item(row, 3)  # Колонка "Источник"
-                    if source_item:
-                        source_path = source_item.text()
-                        # Проверяем, что это путь к файлу (не "-" и содержит расширение)
-                        if source_path == '-' or not source_path:
-                            return
-                        
-                        # Если путь абсолютный и существует - открываем
-                        if os.path.isabs(source_path) and os.path.exists(source_path):
-                            self.reveal_in_file_manager(source_path, select=True)
-                            return
-                        
-                        # Если путь относительный (только имя файла) - пытаемся найти в известных местах
-                        if not os.path.isabs(source_path):
-                            search_locations = [
-                                os.getcwd(),  # Текущая рабочая директория
-                                os.path.expanduser("~/Desktop"),  # Рабочий стол
-                                os.path.expanduser("~/Documents"),  # Документы
-                                os.path.expanduser("~/Downloads"),  # Загрузки
-                            ]
-                            
-                            # Также добавляем папку последнего выбранного файла (если есть)
-                            if hasattr(self, 'last_input_file') and self.last_input_file:
-                                last_dir = os.path.dirname(self.last_input_file)
-                                if last_dir and last_dir not in search_locations:
-                                    search_locations.insert(0, last_dir)
-                            
-                            # Ищем файл в этих папках
-                            found_path = None
-                            for location in search_locations:
-                                potential_path = os.path.join(location, source_path)
-                                if os.path.exists(potential_path):
-                                    found_path = potential_path
-                                    break
-                            
-                            if found_path:
-                                self.reveal_in_file_manager(found_path, select=True)
-                                return
-                        
-                        # Файл не найден нигде
-                        QMessageBox.information(
-                            dialog,
-                            "Файл не найден",
-                            f"Файл-источник не найден:\n{source_path}\n\n"
-                            f"Возможно, он был перемещен или удален.\n\n"
-                            f"Проверенные места:\n"
-                            f"• Абсолютный путь\n"
-                            f"• Текущая директория\n"
-                            f"• Рабочий стол\n"
-                            f"• Документы\n"
-                            f"• Загрузки"
-                        )
-                
-                history_table.doubleClicked.connect(open_source_file)
-                history_layout.addWidget(history_table)
-            else:
-                no_history_label = QLabel("История пуста")
-                history_layout.addWidget(no_history_label)
-
-            history_group.setLayout(history_layout)
-            layout.addWidget(history_group)
-
-            # Кнопки
-            button_layout = QHBoxLayout()
-            
-            # Крупный шрифт для кнопок (базовый 14pt)
-            button_font_size = max(12, int(14 * self.scale_factor))
-            button_font = QFont(get_system_font(), button_font_size)
-            
-            export_btn = QPushButton("📤 Экспорт в Excel")
-            export_btn.setFont(button_font)
-            export_btn.clicked.connect(lambda: self.export_database())
-            button_layout.addWidget(export_btn)
-            
-            button_layout.addStretch()
-            
-            close_btn = QPushButton("Закрыть")
-            close_btn.setFont(button_font)
-            close_btn.clicked.connect(dialog.accept)
-            button_layout.addWidget(close_btn)
-            
-            layout.addLayout(button_layout)
-            dialog.setLayout(layout)
+
+    def on_view_database(self):
+        """Показывает содержимое базы данных с историей формирования"""
+        try:
+            from .component_database import load_component_database
             
-            dialog.exec()
+            # Загружаем базу данных
+            db = load_component_database()
+            stats = get_database_stats()
+            history = get_database_history()
+
+            # Диалог создается один раз, при повторных открытиях обновляются только данные
+            if self._db_view_dialog is None:
+                self._db_view_dialog = DatabaseViewDialog(self)
+            self._db_view_dialog.refresh(stats, history)
+            self._db_view_dialog.exec()
             
         except Exception as e:
             QMessageBox.critical(
@@ -2685,21 +3501,87 @@ class BOMCategorizerMainWindow(QMainWindow):
                 f"Не удалось открыть базу данных:\n{str(e)}"
             )
 
+    def open_history_source(self, source_path: str, parent: QWidget):
+        """
+        Открывает файл-источник из истории БД в проводнике
+
+        Args:
+            source_path: Путь или имя файла из колонки "Источник"
+            parent: Родитель для сообщения "Файл не найден"
+        """
+        # Проверяем, что это путь к файлу (не "-" и содержит расширение)
+        if source_path == '-' or not source_path:
+            return
+        
+        is_abs_path = os.path.isabs(source_path)
+
+        # Если путь абсолютный и существует - открываем
+        if is_abs_path and os.path.exists(source_path):
+            self.reveal_in_file_manager_async(source_path)
+            return
+        
+        # Если путь относительный (только имя файла) - пытаемся найти в известных местах
+        if not is_abs_path:
+            search_locations = list(self._get_source_search_dirs())
+            
+            # Также добавляем папку последнего выбранного файла (если есть)
+            if self.last_input_file:
+                last_dir = os.path.dirname(self.last_input_file)
+                if last_dir and last_dir not in search_locations:
+                    search_locations.insert(0, last_dir)
+            
+            # Ищем файл в этих папках
+            found_path = None
+            for location in search_locations:
+                potential_path = os.path.join(location, source_path)
+                if os.path.exists(potential_path):
+                    found_path = potential_path
+                    break
+            
+            if found_path:
+                self.reveal_in_file_manager_async(found_path)
+                return
+        
+        # Файл не найден нигде
+        QMessageBox.information(
+            parent,
+            "Файл не найден",
+            f"Файл-источник не найден:\n{source_path}\n\n"
+            f"Возможно, он был перемещен или удален.\n\n"
+            f"Проверенные места:\n"
+            f"• Абсолютный путь\n"
+            f"• Текущая директория\n"
+            f"• Рабочий стол\n"
+            f"• Документы\n"
+            f"• Загрузки"
+        )
+
+    def _get_source_search_dirs(self) -> tuple:
+        """
+        Возвращает папки для поиска файлов-источников из истории БД
+
+        Список вычисляется один раз при первом обращении и кэшируется.
+        """
+        if self._source_search_dirs is None:
+            self._source_search_dirs = tuple(filter(os.path.isdir, (
+                os.getcwd(),  # Текущая рабочая директория
+                os.path.expanduser("~/Desktop"),  # Рабочий стол
+                os.path.expanduser("~/Documents"),  # Документы
+                os.path.expanduser("~/Downloads"),  # Загрузки
+            )))
+        return self._source_search_dirs
+
     def on_clear_database(self):
         """Очищает базу данных компонентов"""
-        # Получаем текущую статистику
-        stats = get_database_stats()
+        # Получаем текущую статистику (из кэша, если БД не менялась)
+        stats, _ = self._cached_stats()
         total = stats.get('total', 0)
         
         # Подтверждение
         reply = QMessageBox.question(
             self,
             "Подтверждение очистки",
-            f"⚠️ Вы уверены, что хотите очистить базу данных?\n\n"
-            f"Текущее количество компонентов: {total}\n\n"
-            f"❗ Это действие создаст резервную копию старой базы,\n"
-            f"но все компоненты будут удалены из основной базы.\n\n"
-            f"Продолжить?",
+            _CLEAR_CONFIRM_TMPL.format(total=total),
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
@@ -2719,11 +3601,10 @@ class BOMCategorizerMainWindow(QMainWindow):
                     QMessageBox.information(
                         self,
                         "Успех",
-                        f"✅ База данных успешно очищена!\n\n"
-                        f"Удалено компонентов: {total}\n\n"
-                        f"Резервная копия старой базы сохранена в папке:\n"
-                        f"{os.path.join(os.path.dirname(get_database_path()), 'backups')}\n\n"
-                        f"Информация в футере обновлена!"
+                        _CLEAR_SUCCESS_TMPL.format(
+                            total=total,
+                            backup_dir=os.path.join(os.path.dirname(get_database_path()), 'backups')
+                        )
                     )
                 else:
                     QMessageBox.warning(
@@ -2750,11 +3631,7 @@ class BOMCategorizerMainWindow(QMainWindow):
         text, ok = QInputDialog.getText(
             self,
             "Изменить версию БД",
-            f"Текущая версия: {current_version}\n\n"
-            f"Введите новую версию в формате X.Y:\n"
-            f"(X увеличивается при импорте из файлов,\n"
-            f"Y увеличивается при ручном добавлении элементов)\n"
-            f"Версия 0.0 означает пустую базу после очистки.",
+            _VERSION_PROMPT_TMPL.format(current_version=current_version),
             QLineEdit.Normal,
             current_version
         )
@@ -2794,11 +3671,7 @@ class BOMCategorizerMainWindow(QMainWindow):
                     QMessageBox.information(
                         self,
                         "Успех",
-                        f"✅ Версия БД успешно изменена!\n\n"
-                        f"Старая версия: {current_version}\n"
-                        f"Новая версия: {text}\n\n"
-                        f"Запись добавлена в историю БД.\n"
-                        f"Информация в футере обновлена!"
+                        _VERSION_SUCCESS_TMPL.format(current_version=current_version, new_version=text)
                     )
                 else:
                     QMessageBox.warning(
@@ -2814,6 +3687,40 @@ class BOMCategorizerMainWindow(QMainWindow):
                     "Версия должна содержать числа (например, 2.5)"
                 )
 
+    def _run_database_task(self, message: str, task, on_finished):
+        """
+        Выполняет операцию с БД в фоновом потоке с индикатором ожидания
+
+        Args:
+            message: Текст индикатора
+            task: Функция без аргументов, выполняемая в рабочем потоке
+            on_finished: Слот (success, result, error_message), вызывается в GUI потоке
+        """
+        # Одновременно выполняется только одна операция с БД
+        if self.database_worker is not None and self.database_worker.isRunning():
+            return
+
+        progress_dialog = QProgressDialog(message, None, 0, 0, self)
+        progress_dialog.setWindowTitle("База данных")
+        # ApplicationModal - блокируем и открытый диалог просмотра БД (кнопка экспорта)
+        progress_dialog.setWindowModality(Qt.ApplicationModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setCancelButton(None)  # Операцию нельзя прервать
+        progress_dialog.show()
+        self._database_task_state = (progress_dialog, on_finished)
+
+        # Храним ссылку на worker, чтобы поток не был удален до завершения
+        self.database_worker = DatabaseTaskWorker(task)
+        self.database_worker.finished.connect(self.on_database_task_finished)
+        self.database_worker.start()
+
+    def on_database_task_finished(self, success: bool, result, error_message: str):
+        """Обработка завершения фоновой операции с БД (в GUI потоке)"""
+        progress_dialog, on_finished = self._database_task_state
+        self._database_task_state = None
+        progress_dialog.close()
+        on_finished(success, result, error_message)
+
     def export_database(self):
         """Экспорт базы данных в Excel"""
         file_path, _ = QFileDialog.getSaveFileName(
@@ -2824,21 +3731,25 @@ class BOMCategorizerMainWindow(QMainWindow):
         )
 
         if file_path:
-            try:
-                row_count = export_database_to_excel(file_path)
-                QMessageBox.information(
-                    self,
-                    "Экспорт завершен",
-                    f"✅ База данных успешно экспортирована!\n\n"
-                    f"Файл: {file_path}\n"
-                    f"Компонентов: {row_count}"
-                )
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Ошибка экспорта",
-                    f"Не удалось экспортировать базу данных:\n{str(e)}"
-                )
+            def on_finished(success: bool, row_count, error_message: str):
+                if success:
+                    QMessageBox.information(
+                        self,
+                        "Экспорт завершен",
+                        _EXPORT_SUCCESS_TMPL.format(file_path=file_path, row_count=row_count)
+                    )
+                else:
+                    QMessageBox.critical(
+                        self,
+                        "Ошибка экспорта",
+                        f"Не удалось экспортировать базу данных:\n{error_message}"
+                    )
+
+            self._run_database_task(
+                "Экспорт базы данных в Excel...",
+                lambda: export_database_to_excel(file_path),
+                on_finished
+            )
 
     def import_database(self):
         """Импорт базы данных из Excel"""
@@ -2849,65 +3760,72 @@ class BOMCategorizerMainWindow(QMainWindow):
             "Поддерживаемые файлы (*.xlsx *.json);;Excel файлы (*.xlsx);;JSON файлы (*.json)"
         )
 
-        if file_path:
-            try:
-                if file_path.endswith('.json'):
-                    import shutil
-                    db_path = get_database_path()
-                    # Создаем резервную копию
-                    backup_database()
-                    # Копируем новый файл
-                    shutil.copy2(file_path, db_path)
-                    stats = get_database_stats()
-                    imported_count = stats.get('total', 0)
-                elif file_path.endswith('.xlsx'):
-                    # Создаем резервную копию
-                    backup_database()
-                    # Импортируем из Excel
-                    imported_count = import_database_from_excel(file_path, replace=True)
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Неподдерживаемый формат",
-                        "Поддерживаются только файлы .xlsx и .json"
-                    )
-                    return
+        if not file_path:
+            return
 
-                # Обновляем футер после импорта
-                self.update_database_info()
-                
-                QMessageBox.information(
-                    self,
-                    "Импорт завершен",
-                    f"✅ База данных успешно импортирована!\n\n"
-                    f"Компонентов импортировано: {imported_count}\n"
-                    f"База данных: {get_database_path()}\n\n"
-                    f"Информация в футере обновлена!"
-                )
-            except Exception as e:
+        if not file_path.endswith(('.json', '.xlsx')):
+            QMessageBox.warning(
+                self,
+                "Неподдерживаемый формат",
+                "Поддерживаются только файлы .xlsx и .json"
+            )
+            return
+
+        def import_task() -> int:
+            # Выполняется в рабочем потоке - без обращений к виджетам
+            if file_path.endswith('.json'):
+                import shutil
+                db_path = get_database_path()
+                # Создаем резервную копию
+                backup_database()
+                # Копируем новый файл
+                shutil.copy2(file_path, db_path)
+                invalidate_database_stats_cache()
+                return get_database_stats().get('total', 0)
+            # Создаем резервную копию
+            backup_database()
+            # Импортируем из Excel
+            return import_database_from_excel(file_path, replace=True)
+
+        def on_finished(success: bool, imported_count, error_message: str):
+            if not success:
                 QMessageBox.critical(
                     self,
                     "Ошибка импорта",
-                    f"Не удалось импортировать базу данных:\n{str(e)}"
+                    f"Не удалось импортировать базу данных:\n{error_message}"
                 )
+                return
 
-    def backup_database(self):
-        """Создает резервную копию базы данных"""
-        try:
-            backup_file = backup_database()
+            # Обновляем футер после импорта
+            self.update_database_info()
+            
             QMessageBox.information(
                 self,
-                "Резервное копирование",
-                f"✅ Резервная копия создана успешно!\n\n"
-                f"Файл: {backup_file}"
-            )
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Ошибка",
-                f"Не удалось создать резервную копию:\n{str(e)}"
+                "Импорт завершен",
+                _IMPORT_SUCCESS_TMPL.format(imported_count=imported_count, db_path=get_database_path())
             )
 
+        self._run_database_task("Импорт базы данных...", import_task, on_finished)
+
+    def backup_database(self):
+        """Создает резервную копию базы данных"""
+        def on_finished(success: bool, backup_file, error_message: str):
+            if success:
+                QMessageBox.information(
+                    self,
+                    "Резервное копирование",
+                    f"✅ Резервная копия создана успешно!\n\n"
+                    f"Файл: {backup_file}"
+                )
+            else:
+                QMessageBox.critical(
+                    self,
+                    "Ошибка",
+                    f"Не удалось создать резервную копию:\n{error_message}"
+                )
+
+        self._run_database_task("Создание резервной копии...", backup_database, on_finished)
+
     def open_database_folder(self):
         """Открывает папку с базой данных в проводнике с выделенным файлом"""
         try:
@@ -2919,52 +3837,19 @@ class BOMCategorizerMainWindow(QMainWindow):
 
     def show_about(self):
         """Показывает информацию о программе"""
-        ver = self.cfg.get("app_info", {}).get("version", "dev")
-        edition = self.cfg.get("app_info", {}).get("edition", "Modern Edition")
-        
-        about_text = f"""
-<h2>BOM Categorizer {edition}</h2>
-<p><b>Версия:</b> {ver}</p>
-<p><b>Разработчик:</b> Куреин М.Н. / Kurein M.N.</p>
-<p><b>Дата выпуска:</b> {self.cfg.get('app_info', {}).get('release_date', 'N/A')}</p>
-
-<p><b>Возможности:</b></p>
-<ul>
-<li>📋 Обработка файлов: XLSX, DOCX, TXT</li>
-<li>🤖 Автоматическая классификация компонентов</li>
-<li>🎨 Форматирование и сортировка</li>
-<li>🗄️ База данных компонентов с версионированием</li>
-<li>🖥️ Современный темный/светлый интерфейс</li>
-<li>🔒 PIN защита</li>
-<li>💾 Экспорт в Excel и TXT</li>
-<li>📊 Сравнение BOM файлов</li>
-<li>🔍 Контекстная помощь (F1)</li>
-</ul>
-
-<p><b>Горячие клавиши:</b></p>
-<ul>
-<li><b>Ctrl+O</b> - Открыть файлы</li>
-<li><b>Ctrl+R</b> - Запустить обработку</li>
-<li><b>Ctrl+Q</b> - Выход</li>
-<li><b>F1</b> - Контекстная помощь</li>
-<li><b>Ctrl+T</b> - Переключить тему</li>
-<li><b>Ctrl+Plus/Minus</b> - Изменить масштаб</li>
-<li><b>Ctrl+0</b> - Сбросить масштаб</li>
-</ul>
-
-<p><b>Drag & Drop:</b></p>
-<p>Перетащите файлы (XLSX, DOCX, DOC, TXT) прямо в окно приложения для быстрого добавления.</p>
-
-<p><b>Лицензия:</b></p>
-<p style="font-size: 10pt;">
-Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
-Все права защищены.<br><br>
-Данное программное обеспечение предоставляется "как есть", без каких-либо явных или подразумеваемых гарантий, включая, но не ограничиваясь гарантиями товарной пригодности, пригодности для определенной цели и отсутствия нарушений прав.<br><br>
-В случае возникновения вопросов или проблем обращайтесь к разработчику.
-</p>
-
-<p style="color: #7287fd;"><b>Modern Edition</b> на основе PySide6 (Qt)</p>
-        """
+        # Диалог создается один раз - данные app_info не меняются во время работы
+        if self._about_dialog is None:
+            self._about_dialog = self._create_about_dialog()
+        self._about_dialog.exec()
+
+    def _create_about_dialog(self) -> QDialog:
+        """Создает диалог "О программе" """
+        app_info = self.cfg.get("app_info", {})
+        about_text = _ABOUT_TEMPLATE.format_map({
+            "version": app_info.get("version", "dev"),
+            "edition": app_info.get("edition", "Modern Edition"),
+            "release_date": app_info.get("release_date", "N/A"),
+        })
 
         # Создаем кастомный диалог для поддержки кликабельных ссылок
         dialog = QDialog(self)
@@ -2995,7 +3880,7 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         layout.addWidget(close_btn)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
 
     def show_context_help(self):
         """Показывает контекстную помощь для текущего элемента"""
@@ -3024,172 +3909,44 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             QMessageBox.information(
                 self,
                 "Контекстная помощь",
-                "📖 <b>Контекстная помощь</b><br><br>"
-                "Наведите курсор на элемент интерфейса и нажмите <b>F1</b> для получения справки.<br><br>"
-                "Или выберите элемент и нажмите <b>F1</b> для получения подробной информации.<br><br>"
-                "<b>Доступные элементы с помощью:</b><br>"
-                "• Кнопки (Добавить файлы, Запустить обработку, и т.д.)<br>"
-                "• Поля ввода<br>"
-                "• Списки файлов<br>"
-                "• Область лога<br>"
-                "• Меню и пункты меню"
+                _DEFAULT_HELP_HTML
             )
     
     def _get_context_help(self, widget) -> str:
         """Возвращает текст помощи для конкретного виджета"""
-        if widget is None:
-            return ""
+        # Под курсором нет конкретного элемента - сразу общая справка
+        if widget is None or widget is self:
+            return _DEFAULT_HELP_HTML
         
         widget_type = type(widget).__name__
-        widget_text = ""
         widget_object_name = widget.objectName() if hasattr(widget, 'objectName') else ""
         
-        # Пытаемся получить текст из виджета разными способами
-        if hasattr(widget, 'text'):
-            widget_text = widget.text()
-        elif hasattr(widget, 'toolTip'):
-            widget_text = widget.toolTip()
-        elif hasattr(widget, 'windowTitle'):
-            widget_text = widget.windowTitle()
-        elif hasattr(widget, 'placeholderText'):
-            widget_text = widget.placeholderText()
+        # Получаем текст виджета (способ определяется по типу)
+        widget_text = _get_widget_text(widget)
         
         # Если текст пустой, пробуем получить из родительского виджета (для кнопок в меню)
-        if not widget_text and hasattr(widget, 'parent'):
+        if not widget_text:
             parent = widget.parent()
-            if parent and hasattr(parent, 'text'):
-                widget_text = parent.text()
-        
-        # Нормализуем текст (убираем эмодзи и лишние пробелы)
-        widget_text_clean = widget_text.strip()
-        # Убираем эмодзи для поиска
-        widget_text_clean = re.sub(r'[^\w\s]', '', widget_text_clean).strip()
-        
-        # База знаний для различных элементов
-        help_map = {
-            'QPushButton': {
-                'Добавить файлы': '📂 <b>Добавить файлы</b><br><br>'
-                    'Добавляет BOM файлы для обработки. Поддерживаются форматы:<br>'
-                    '• Excel (.xlsx) - основной формат<br>'
-                    '• Word (.docx, .doc) - автоматически конвертируется<br>'
-                    '• Текст (.txt) - простой текстовый формат<br><br>'
-                    'Можно выбрать несколько файлов одновременно.<br>'
-                    'Также можно перетащить файлы прямо в окно приложения.<br><br>'
-                    '<b>Горячая клавиша:</b> Ctrl+O',
-                '➕ Добавить файлы': '📂 <b>Добавить файлы</b><br><br>'
-                    'Добавляет BOM файлы для обработки. Поддерживаются форматы:<br>'
-                    '• Excel (.xlsx) - основной формат<br>'
-                    '• Word (.docx, .doc) - автоматически конвертируется<br>'
-                    '• Текст (.txt) - простой текстовый формат<br><br>'
-                    'Можно выбрать несколько файлов одновременно.<br>'
-                    'Также можно перетащить файлы прямо в окно приложения.<br><br>'
-                    '<b>Горячая клавиша:</b> Ctrl+O',
-                '🗑️ Очистить список': '🗑️ <b>Очистить список</b><br><br>'
-                    'Удаляет все файлы из списка обработки.<br>'
-                    'Количество экземпляров для каждого файла сбрасывается.',
-                'Очистить список': '🗑️ <b>Очистить список</b><br><br>'
-                    'Удаляет все файлы из списка обработки.<br>'
-                    'Количество экземпляров для каждого файла сбрасывается.',
-                '▶️ Запустить обработку': '🚀 <b>Запустить обработку</b><br><br>'
-                    'Начинает обработку выбранных BOM файлов с автоматической классификацией компонентов.<br><br>'
-                    '<b>Процесс:</b><br>'
-                    '1. Конвертация .doc файлов в .docx (если нужно)<br>'
-                    '2. Парсинг BOM файлов<br>'
-                    '3. Автоматическая классификация по базе данных<br>'
-                    '4. Создание выходного Excel файла с категориями<br><br>'
-                    '<b>Горячая клавиша:</b> Ctrl+R',
-                '🚀 Запустить обработку': '🚀 <b>Запустить обработку</b><br><br>'
-                    'Начинает обработку выбранных BOM файлов с автоматической классификацией компонентов.<br><br>'
-                    '<b>Процесс:</b><br>'
-                    '1. Конвертация .doc файлов в .docx (если нужно)<br>'
-                    '2. Парсинг BOM файлов<br>'
-                    '3. Автоматическая классификация по базе данных<br>'
-                    '4. Создание выходного Excel файла с категориями<br><br>'
-                    '<b>Горячая клавиша:</b> Ctrl+R',
-                'Запустить обработку': '🚀 <b>Запустить обработку</b><br><br>'
-                    'Начинает обработку выбранных BOM файлов с автоматической классификацией компонентов.<br><br>'
-                    '<b>Процесс:</b><br>'
-                    '1. Конвертация .doc файлов в .docx (если нужно)<br>'
-                    '2. Парсинг BOM файлов<br>'
-                    '3. Автоматическая классификация по базе данных<br>'
-                    '4. Создание выходного Excel файла с категориями<br><br>'
-                    '<b>Горячая клавиша:</b> Ctrl+R',
-                '🔄 Интерактивная классификация': '🎯 <b>Интерактивная классификация</b><br><br>'
-                    'Открывает диалог для ручной классификации нераспределенных компонентов.<br><br>'
-                    '<b>Использование:</b><br>'
-                    '1. Выберите компонент из списка<br>'
-                    '2. Выберите категорию<br>'
-                    '3. Компонент будет добавлен в базу данных<br>'
-                    '4. Повторите для всех нераспределенных компонентов',
-                'Интерактивная классификация': '🎯 <b>Интерактивная классификация</b><br><br>'
-                    'Открывает диалог для ручной классификации нераспределенных компонентов.<br><br>'
-                    '<b>Использование:</b><br>'
-                    '1. Выберите компонент из списка<br>'
-                    '2. Выберите категорию<br>'
-                    '3. Компонент будет добавлен в базу данных<br>'
-                    '4. Повторите для всех нераспределенных компонентов',
-                '⚡ Сравнить файлы': '🔍 <b>Сравнить файлы</b><br><br>'
-                    'Сравнивает два BOM файла и показывает различия.<br><br>'
-                    '<b>Требования:</b><br>'
-                    '• Оба файла должны быть уже обработаны (с категориями)<br>'
-                    '• Если файлы не обработаны, появится предупреждение<br><br>'
-                    'Результат покажет добавленные, удаленные и измененные компоненты.',
-                'Сравнить файлы': '🔍 <b>Сравнить файлы</b><br><br>'
-                    'Сравнивает два BOM файла и показывает различия.<br><br>'
-                    '<b>Требования:</b><br>'
-                    '• Оба файла должны быть уже обработаны (с категориями)<br>'
-                    '• Если файлы не обработаны, появится предупреждение<br><br>'
-                    'Результат покажет добавленные, удаленные и измененные компоненты.',
-                'Выбрать': '📁 <b>Выбрать файл</b><br><br>'
-                    'Открывает диалог выбора файла для сохранения результата обработки.',
-            },
-            'QLineEdit': {
-                'Выходной файл': '📄 <b>Выходной файл</b><br><br>'
-                    'Имя файла для сохранения результата обработки.<br><br>'
-                    '<b>По умолчанию:</b><br>'
-                    '• Для одного файла: {имя_файла}_categorized.xlsx<br>'
-                    '• Для нескольких файлов: categorized.xlsx<br>'
-                    '• Сохраняется в папке первого входного файла<br>'
-                    '• Если файл существует, добавляется _1, _2 и т.д.',
-            },
-            'QListWidget': {
-                '': '📋 <b>Список файлов</b><br><br>'
-                    'Список выбранных файлов для обработки.<br><br>'
-                    '<b>Действия:</b><br>'
-                    '• Выберите файл для изменения количества экземпляров<br>'
-                    '• Двойной клик открывает диалог изменения количества<br>'
-                    '• Файлы можно удалить через контекстное меню',
-            },
-            'QTextEdit': {
-                'Лог выполнения': '📝 <b>Лог выполнения</b><br><br>'
-                    'Отображает информацию о процессе обработки файлов.<br><br>'
-                    '<b>Функции:</b><br>'
-                    '• Показывает прогресс обработки<br>'
-                    '• Отображает ошибки и предупреждения<br>'
-                    '• Двойной клик открывает лог в текстовом редакторе<br>'
-                    '• В экспертном режиме можно включить временные метки',
-            },
-            'QTextBrowser': {
-                '': '📖 <b>Текстовая область</b><br><br>'
-                    'Область для отображения текстовой информации с поддержкой HTML и ссылок.',
-            },
-            'QLabel': {
-                '': '🏷️ <b>Метка</b><br><br>'
-                    'Текстовая метка для отображения информации или подсказок.',
-            },
-        }
+            parent_text = getattr(parent, 'text', None) if parent else None
+            if parent_text is not None:
+                widget_text = parent_text()
+        
+        help_map = _HELP_MAP
         
         # Ищем помощь для конкретного виджета по тексту
         if widget_type in help_map:
             # Сначала ищем по полному тексту
             if widget_text in help_map[widget_type]:
                 return help_map[widget_type][widget_text]
-            # Затем ищем по очищенному тексту
-            if widget_text_clean in help_map[widget_type]:
-                return help_map[widget_type][widget_text_clean]
+            # Затем ищем по нормализованному тексту (без эмодзи, в нижнем регистре)
+            value = _HELP_MAP_NORMALIZED[widget_type].get(_normalize_help_key(widget_text))
+            if value is not None:
+                return value
             # Ищем частичное совпадение
+            widget_text_lower = widget_text.lower()
             for key, value in help_map[widget_type].items():
-                if key and (key.lower() in widget_text.lower() or widget_text.lower() in key.lower()):
+                key_lower = key.lower()
+                if key and (key_lower in widget_text_lower or widget_text_lower in key_lower):
                     return value
             # Если есть общая помощь для типа виджета
             if '' in help_map[widget_type]:
@@ -3199,25 +3956,20 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         if widget_type == 'QAction':
             action_text = widget.text() if hasattr(widget, 'text') else ""
             if action_text:
-                # Ищем в базе знаний по тексту действия
+                # Сначала точный поиск по нормализованному тексту действия
+                value = _HELP_MAP_NORMALIZED['QPushButton'].get(_normalize_help_key(action_text))
+                if value is not None:
+                    return value
+                # Ищем в базе знаний по частичному совпадению текста действия
+                action_text_lower = action_text.lower()
                 for key, value in help_map.get('QPushButton', {}).items():
-                    if key.lower() in action_text.lower() or action_text.lower() in key.lower():
+                    key_lower = key.lower()
+                    if key_lower in action_text_lower or action_text_lower in key_lower:
                         return value
         
         # Общая помощь по типу виджета
-        general_help = {
-            'QPushButton': '🔘 <b>Кнопка</b><br><br>Кнопка для выполнения действия. Нажмите для активации.',
-            'QLineEdit': '📝 <b>Поле ввода</b><br><br>Поле ввода текста. Введите значение или используйте кнопку "Выбрать..." для выбора файла.',
-            'QSpinBox': '🔢 <b>Числовое поле</b><br><br>Поле для ввода числового значения. Используйте стрелки или введите значение вручную.',
-            'QCheckBox': '☑️ <b>Флажок</b><br><br>Флажок для включения/выключения опции.',
-            'QListWidget': '📋 <b>Список</b><br><br>Список элементов. Выберите элемент для работы с ним.',
-            'QTextEdit': '📄 <b>Текстовое поле</b><br><br>Текстовое поле для отображения и редактирования информации.',
-            'QMenu': '📋 <b>Меню</b><br><br>Меню для доступа к функциям приложения.',
-            'QMenuBar': '📋 <b>Строка меню</b><br><br>Главное меню приложения с разделами: Файл, Вид, База данных, Помощь.',
-        }
-        
-        if widget_type in general_help:
-            return general_help[widget_type]
+        if widget_type in _GENERAL_HELP:
+            return _GENERAL_HELP[widget_type]
         
         # Если ничего не найдено, возвращаем информацию о виджете
         widget_info = f"<b>{widget_type}</b>"
@@ -3227,174 +3979,89 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             widget_info += f"<br><b>Имя:</b> {widget_object_name}"
         widget_info += "<br><br>Для этого элемента пока нет подробной справки."
         
-        return widget_info
-    
-    def show_knowledge_base(self):
-        """Показывает базу знаний с поиском"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("📚 База знаний")
-        dialog.resize(800, 600)
-        
-        layout = QVBoxLayout()
-        
-        # Поле поиска
-        search_layout = QHBoxLayout()
-        search_label = QLabel("🔍 Поиск:")
-        search_input = QLineEdit()
-        search_input.setPlaceholderText("Введите ключевое слово для поиска...")
-        search_button = QPushButton("Найти")
-        
-        search_layout.addWidget(search_label)
-        search_layout.addWidget(search_input)
-        search_layout.addWidget(search_button)
-        layout.addLayout(search_layout)
-        
-        # Область с результатами
-        results_text = QTextEdit()
-        results_text.setReadOnly(True)
-        results_text.setFont(QFont("Consolas", 10))
-        layout.addWidget(results_text)
-        
-        # Кнопки
-        button_layout = QHBoxLayout()
-        close_btn = QPushButton("Закрыть")
-        close_btn.clicked.connect(dialog.accept)
-        button_layout.addStretch()
-        button_layout.addWidget(close_btn)
-        layout.addLayout(button_layout)
-        
-        # База знаний
-        knowledge_base = {
-            'обработка': {
-                'title': 'Обработка BOM файлов',
-                'content': '''
-<b>Как обработать BOM файлы:</b>
-1. Нажмите "➕ Добавить файлы" и выберите файлы (XLSX, DOCX, TXT)
-2. Укажите количество экземпляров для каждого файла (если нужно)
-3. Выберите выходной файл (по умолчанию сохраняется в папке первого файла)
-4. Нажмите "🚀 Запустить обработку"
-
-<b>Поддерживаемые форматы:</b>
-• Excel (.xlsx) - основной формат
-• Word (.docx, .doc) - автоматически конвертируется
-• Текст (.txt) - простой текстовый формат
-
-<b>Результат:</b>
-Создается Excel файл с листами по категориям компонентов.
-'''
-            },
-            'классификация': {
-                'title': 'Классификация компонентов',
-                'content': '''
-<b>Автоматическая классификация:</b>
-Компоненты автоматически классифицируются по базе данных.
-
-<b>Интерактивная классификация:</b>
-Если есть нераспределенные компоненты:
-1. После обработки откроется диалог
-2. Выберите компонент из списка
-3. Выберите категорию
-4. Компонент будет добавлен в базу данных
-
-<b>Категории:</b>
-• Резисторы, Конденсаторы, Индуктивности
-• Микросхемы, Диоды, Транзисторы
-• Разъемы, Механика, Прочее
-'''
-            },
-            'база данных': {
-                'title': 'База данных компонентов',
-                'content': '''
-<b>Управление базой данных:</b>
-• <b>Статистика</b> - просмотр информации о БД
-• <b>Экспорт в Excel</b> - сохранение БД для редактирования
-• <b>Импорт из Excel</b> - загрузка БД из файла
-• <b>Резервное копирование</b> - создание бэкапа
-• <b>Посмотреть базу</b> - просмотр истории изменений
-• <b>Очистить базу</b> - удаление всех компонентов
-
-<b>Версионирование:</b>
-База данных использует версионирование X.Y:
-• X увеличивается при импорте из файлов
-• Y увеличивается при ручном добавлении
-'''
-            },
-            'сравнение': {
-                'title': 'Сравнение BOM файлов',
-                'content': '''
-<b>Как сравнить файлы:</b>
-1. Выберите первый файл (базовый)
-2. Выберите второй файл (новый)
-3. Укажите файл результата
-4. Нажмите "⚡ Сравнить файлы"
-
-<b>Результат:</b>
-Создается Excel файл с листами:
-• "Добавлено" - новые компоненты
-• "Удалено" - удаленные компоненты
-• "Изменено" - измененные компоненты
-'''
-            },
-            'масштаб': {
-                'title': 'Масштабирование интерфейса',
-                'content': '''
-<b>Изменение масштаба:</b>
-• Меню "Вид" → "Масштабирование интерфейса"
-• Горячие клавиши: Ctrl+Plus, Ctrl+Minus, Ctrl+0
-
-<b>Доступные масштабы:</b>
-70%, 80%, 90%, 100%, 110%, 125%
-
-Масштаб сохраняется в настройках.
-'''
-            },
-            'режимы': {
-                'title': 'Режимы работы',
-                'content': '''
-<b>Простой режим:</b>
-Упрощенный интерфейс (по умолчанию).
-Скрыты: сравнение файлов, лог, меню базы данных.
-
-<b>Расширенный режим:</b>
-Все функции доступны.
+        return widget_info
+    
+    def show_knowledge_base(self):
+        """Показывает базу знаний с поиском"""
+        # Диалог создается при первом открытии и переиспользуется
+        if self._knowledge_base_dialog is None:
+            self._knowledge_base_dialog = self._create_knowledge_base_dialog()
+        self._knowledge_base_dialog.exec()
 
-<b>Экспертный режим:</b>
-Дополнительные настройки:
-• Временные метки в логе
-• Автоматическое открытие папки результата
-'''
-            },
-        }
+    def _create_knowledge_base_dialog(self) -> QDialog:
+        """Создает диалог базы знаний"""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("📚 База знаний")
+        dialog.resize(800, 600)
+        
+        layout = QVBoxLayout()
+        
+        # Поле поиска
+        search_layout = QHBoxLayout()
+        search_label = QLabel("🔍 Поиск:")
+        search_input = QLineEdit()
+        search_input.setPlaceholderText("Введите ключевое слово для поиска...")
+        search_button = QPushButton("Найти")
+        
+        search_layout.addWidget(search_label)
+        search_layout.addWidget(search_input)
+        search_layout.addWidget(search_button)
+        layout.addLayout(search_layout)
+        
+        # Область с результатами
+        results_text = QTextEdit()
+        results_text.setReadOnly(True)
+        results_text.setFont(self._font(10, family="Consolas"))
+        layout.addWidget(results_text)
+        
+        # Кнопки
+        button_layout = QHBoxLayout()
+        close_btn = QPushButton("Закрыть")
+        close_btn.clicked.connect(dialog.accept)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+        
+        last_query = None  # Последний отображенный запрос (не перерисовываем тот же результат)
         
         def update_results(query=""):
             """Обновляет результаты поиска"""
+            nonlocal last_query
+            if query == last_query:
+                return
+            last_query = query
             if not query.strip():
                 # Показываем все статьи
-                html = "<h2>📚 База знаний</h2><br>"
-                html += "<p>Введите запрос в поле поиска или выберите тему ниже:</p><br>"
-                for key, article in knowledge_base.items():
-                    html += f'<h3>{article["title"]}</h3>'
-                    html += f'<p>{article["content"]}</p>'
-                    html += "<hr>"
+                parts = [
+                    "<h2>📚 База знаний</h2><br>",
+                    "<p>Введите запрос в поле поиска или выберите тему ниже:</p><br>",
+                ]
+                parts.extend(_KB_ARTICLE_HTML.values())
             else:
                 # Поиск по ключевым словам
                 query_lower = query.lower()
-                html = f"<h2>🔍 Результаты поиска: '{query}'</h2><br>"
-                found = False
-                for key, article in knowledge_base.items():
-                    if query_lower in key.lower() or query_lower in article['title'].lower() or query_lower in article['content'].lower():
-                        found = True
-                        html += f'<h3>{article["title"]}</h3>'
-                        html += f'<p>{article["content"]}</p>'
-                        html += "<hr>"
+                parts = [f"<h2>🔍 Результаты поиска: '{query}'</h2><br>"]
+                found = [
+                    _KB_ARTICLE_HTML[key] for key, texts in _KB_LOWER.items()
+                    if any(query_lower in text for text in texts)
+                ]
+                parts.extend(found)
                 if not found:
-                    html += "<p>Ничего не найдено. Попробуйте другие ключевые слова.</p>"
+                    parts.append("<p>Ничего не найдено. Попробуйте другие ключевые слова.</p>")
             
-            results_text.setHtml(html)
+            results_text.setHtml(''.join(parts))
         
         def on_search():
+            search_timer.stop()
             update_results(search_input.text())
         
+        # Поиск по мере ввода с задержкой, чтобы не перерисовывать результаты на каждую букву
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(150)
+        search_timer.timeout.connect(on_search)
+        
+        search_input.textChanged.connect(lambda _text: search_timer.start())
         search_button.clicked.connect(on_search)
         search_input.returnPressed.connect(on_search)
         
@@ -3402,28 +4069,23 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         update_results()
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
     
     def show_system_info(self):
         """Показывает системную информацию для диагностики"""
-        import sys
-        import platform
-        
-        # Собираем информацию о системе
-        system_info = f"""
-<h2>💻 Системная информация</h2>
-
-<h3>Операционная система:</h3>
-<p><b>Платформа:</b> {platform.system()} {platform.release()}</p>
-<p><b>Версия:</b> {platform.version()}</p>
-<p><b>Архитектура:</b> {platform.machine()}</p>
-<p><b>Процессор:</b> {platform.processor()}</p>
+        system_info = self._build_system_info_html()
 
-<h3>Python:</h3>
-<p><b>Версия:</b> {sys.version.split()[0]}</p>
-<p><b>Путь к интерпретатору:</b> {sys.executable}</p>
-<p><b>Платформа Python:</b> {platform.python_implementation()} {platform.python_version()}</p>
+        # Диалог создается один раз, при повторных открытиях обновляется только текст
+        if self._system_info_dialog is None:
+            self._system_info_dialog = self._create_system_info_dialog()
+        self._system_info_html = system_info
+        self._system_info_view.setHtml(system_info)
+        self._system_info_dialog.exec()
 
+    def _build_system_info_html(self) -> str:
+        """Собирает HTML с системной информацией"""
+        # Собираем информацию о системе
+        system_info = _static_system_info_html() + f"""
 <h3>Приложение:</h3>
 <p><b>Версия:</b> {self.cfg.get('app_info', {}).get('version', 'N/A')}</p>
 <p><b>Редакция:</b> {self.cfg.get('app_info', {}).get('edition', 'N/A')}</p>
@@ -3453,7 +4115,10 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
 <h3>Ресурсы:</h3>
 <p><b>GitHub:</b> <a href="https://github.com/kureinmaxim/BOMCategorizer" style="color: #0066cc; font-weight: bold; font-size: 14px; text-decoration: underline;">https://github.com/kureinmaxim/BOMCategorizer</a></p>
 """
-        
+        return system_info
+
+    def _create_system_info_dialog(self) -> QDialog:
+        """Создает диалог системной информации (текст задается в show_system_info)"""
         # Создаем диалог
         dialog = QDialog(self)
         dialog.setWindowTitle("💻 Системная информация")
@@ -3463,13 +4128,13 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         
         text_widget = QTextBrowser()
         text_widget.setOpenExternalLinks(True)  # Разрешаем открытие внешних ссылок
-        text_widget.setHtml(system_info)
-        text_widget.setFont(QFont("Consolas", 9))
+        text_widget.setFont(self._font(9, family="Consolas"))
         layout.addWidget(text_widget)
+        self._system_info_view = text_widget
         
         button_layout = QHBoxLayout()
         copy_btn = QPushButton("📋 Копировать в буфер обмена")
-        copy_btn.clicked.connect(lambda: self._copy_to_clipboard(system_info))
+        copy_btn.clicked.connect(lambda: self._copy_to_clipboard(self._system_info_html))
         close_btn = QPushButton("Закрыть")
         close_btn.clicked.connect(dialog.accept)
         
@@ -3479,138 +4144,26 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         layout.addLayout(button_layout)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
     
     def _copy_to_clipboard(self, text: str):
         """Копирует текст в буфер обмена"""
         from PySide6.QtGui import QClipboard
         clipboard = QApplication.clipboard()
         # Удаляем HTML теги для чистого текста
-        import re
-        plain_text = re.sub('<[^<]+?>', '', text)
+        plain_text = _HTML_TAG_RE.sub('', text)
         clipboard.setText(plain_text)
         self.statusBar().showMessage("✓ Информация скопирована в буфер обмена", 3000)
     
     def show_dragdrop_help(self):
         """Показывает руководство по использованию Drag & Drop"""
-        help_text = """
-<h1 style="color: #89b4fa;">🎯 Улучшенный Drag & Drop</h1>
-
-<h2 style="color: #94e2d5;">Как включить</h2>
-<ol>
-<li>Переключитесь в <b>Экспертный режим</b><br>
-    (Вид → Режим работы → Экспертный режим)</li>
-<li>В секции <b>Экспертные инструменты</b> найдите чекбокс:<br>
-    <i>🎯 Улучшенный Drag & Drop</i></li>
-<li>Установите галочку - функция активируется мгновенно!</li>
-</ol>
-
-<h2 style="color: #94e2d5;">Основные возможности</h2>
-
-<h3 style="color: #f9e2af;">📁 Перетаскивание из проводника</h3>
-<ul>
-<li>Откройте папку с файлами в проводнике Windows</li>
-<li>Выделите нужные файлы (.xlsx, .docx, .txt)</li>
-<li>Перетащите их в список <b>Входные файлы</b></li>
-<li>Зона подсветится синей рамкой при перетаскивании</li>
-</ul>
-
-<h3 style="color: #f9e2af;">🔄 Изменение порядка файлов</h3>
-<ul>
-<li>Зажмите левую кнопку мыши на файле в списке</li>
-<li>Перетащите файл на нужную позицию</li>
-<li>Отпустите кнопку мыши</li>
-<li>Порядок обработки соответствует порядку в списке</li>
-</ul>
-
-<h3 style="color: #f9e2af;">🖱️ Контекстное меню (ПКМ)</h3>
-<p>Щелкните <b>правой кнопкой мыши</b> на любом файле в списке:</p>
-<ul>
-<li><b>📄 Открыть файл</b> - открывает файл в Excel/Word/Notepad</li>
-<li><b>📁 Показать в проводнике</b> - открывает папку и выделяет файл</li>
-<li><b>📋 Копировать путь</b> - копирует полный путь к файлу</li>
-<li><b>🗑️ Удалить из списка</b> - удаляет файл из списка (не физически)</li>
-</ul>
-
-<h2 style="color: #94e2d5;">Примеры использования</h2>
-
-<h3 style="color: #cba6f7;">Пример 1: Быстрое добавление файлов</h3>
-<p style="margin-left: 20px;">
-1. Откройте папку с BOM-файлами<br>
-2. Выделите все нужные файлы (Ctrl+Click)<br>
-3. Перетащите в окно программы<br>
-4. Готово! Все файлы добавлены
-</p>
-
-<h3 style="color: #cba6f7;">Пример 2: Изменение приоритета</h3>
-<p style="margin-left: 20px;">
-Нужно чтобы "БОМ_основной.xlsx" обработался первым:<br>
-• Перетащите его в начало списка<br>
-• Файлы обрабатываются сверху вниз
-</p>
-
-<h3 style="color: #cba6f7;">Пример 3: Быстрое открытие файла</h3>
-<p style="margin-left: 20px;">
-• ПКМ на файле → "📄 Открыть файл"<br>
-• Файл откроется в Excel/Word<br>
-• Удобно для быстрой проверки
-</p>
-
-<h3 style="color: #cba6f7;">Пример 4: Отправка пути коллеге</h3>
-<p style="margin-left: 20px;">
-• ПКМ на файле → "📋 Копировать путь"<br>
-• Ctrl+V в мессенджер/email<br>
-• Коллега получит точный путь к файлу
-</p>
-
-<h2 style="color: #94e2d5;">Горячие клавиши</h2>
-<table style="border-collapse: collapse; width: 100%;">
-<tr style="background-color: #313244;">
-    <th style="padding: 8px; text-align: left; border: 1px solid #45475a;">Действие</th>
-    <th style="padding: 8px; text-align: left; border: 1px solid #45475a;">Клавиша</th>
-</tr>
-<tr>
-    <td style="padding: 8px; border: 1px solid #45475a;">Выделить все файлы</td>
-    <td style="padding: 8px; border: 1px solid #45475a;"><b>Ctrl+A</b></td>
-</tr>
-<tr style="background-color: #1e1e2e;">
-    <td style="padding: 8px; border: 1px solid #45475a;">Множественный выбор</td>
-    <td style="padding: 8px; border: 1px solid #45475a;"><b>Ctrl+Click</b></td>
-</tr>
-<tr>
-    <td style="padding: 8px; border: 1px solid #45475a;">Диапазон выбора</td>
-    <td style="padding: 8px; border: 1px solid #45475a;"><b>Shift+Click</b></td>
-</tr>
-<tr style="background-color: #1e1e2e;">
-    <td style="padding: 8px; border: 1px solid #45475a;">Удалить выбранное</td>
-    <td style="padding: 8px; border: 1px solid #45475a;"><b>Delete</b></td>
-</tr>
-</table>
-
-<h2 style="color: #94e2d5;">⚠️ Важные замечания</h2>
-<ul>
-<li>Поддерживаются только файлы: .xlsx, .docx, .doc, .txt</li>
-<li>При перетаскивании из проводника файлы не перемещаются - добавляется только ссылка</li>
-<li>Для отключения функции требуется перезапуск программы</li>
-<li>Рекомендуется не добавлять более 100 файлов одновременно</li>
-</ul>
-
-<h2 style="color: #94e2d5;">💡 Советы</h2>
-<ul>
-<li>Используйте ПКМ → "Показать в проводнике" для быстрого доступа к папке</li>
-<li>Копирование пути удобно для отправки локации файла другим пользователям</li>
-<li>Изменяйте порядок файлов для контроля последовательности обработки</li>
-<li>Визуальная подсветка показывает что файлы можно сбросить в эту область</li>
-</ul>
-
-<hr style="border: 1px solid #45475a; margin: 20px 0;">
+        # Диалог создается при первом открытии и переиспользуется
+        if self._dragdrop_help_dialog is None:
+            self._dragdrop_help_dialog = self._create_dragdrop_help_dialog()
+        self._dragdrop_help_dialog.exec()
 
-<p style="text-align: center; color: #6c7086;">
-<i>Экспериментальная функция в ветке experimental/new-feature</i><br>
-Полная документация: <b>DRAG_DROP_README.md</b>
-</p>
-"""
-        
+    def _create_dragdrop_help_dialog(self) -> QDialog:
+        """Создает диалог руководства по Drag & Drop"""
         # Создаем диалог
         dialog = QDialog(self)
         dialog.setWindowTitle("🎯 Как использовать Drag & Drop")
@@ -3618,18 +4171,18 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         
         # Применяем шрифт диалога с учётом scale_factor
         dialog_font_size = int(12 * self.scale_factor)
-        dialog.setFont(QFont(get_system_font(), dialog_font_size))
+        dialog.setFont(self._font(dialog_font_size))
         
         layout = QVBoxLayout()
         
         # Текст с прокруткой
         text_widget = QTextBrowser()
         text_widget.setOpenExternalLinks(True)
-        text_widget.setHtml(help_text)
+        text_widget.setHtml(_DRAGDROP_HELP_HTML)
         
         # Применяем шрифт с учётом scale_factor
         font_size = int(10 * self.scale_factor)
-        text_widget.setFont(QFont(get_system_font(), font_size))
+        text_widget.setFont(self._font(font_size))
         layout.addWidget(text_widget)
         
         # Кнопки
@@ -3648,17 +4201,16 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         layout.addLayout(button_layout)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
     
     def _open_dragdrop_readme(self):
         """Открывает файл DRAG_DROP_README.md"""
-        import os
-        readme_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "DRAG_DROP_README.md")
+        readme_path = _DRAGDROP_README_PATH
         if os.path.exists(readme_path):
             try:
-                if platform.system() == 'Windows':
+                if _IS_WINDOWS:
                     os.startfile(readme_path)
-                elif platform.system() == 'Darwin':  # macOS
+                elif _IS_MAC:  # macOS
                     subprocess.Popen(['open', readme_path])
                 else:  # Linux
                     subprocess.Popen(['xdg-open', readme_path])
@@ -3677,19 +4229,13 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Обработка входа перетаскиваемого объекта"""
-        if event.mimeData().hasUrls():
+        mime_data = event.mimeData()
+        if mime_data.hasUrls():
             # Проверяем, что это файлы с поддерживаемыми расширениями
-            urls = event.mimeData().urls()
-            supported_extensions = ['.xlsx', '.docx', '.doc', '.txt']
-            has_supported_file = False
-            
-            for url in urls:
-                file_path = url.toLocalFile()
-                if file_path:
-                    ext = os.path.splitext(file_path)[1].lower()
-                    if ext in supported_extensions:
-                        has_supported_file = True
-                        break
+            has_supported_file = any(
+                url.toLocalFile().lower().endswith(_SUPPORTED_EXTS)
+                for url in mime_data.urls()
+            )
             
             if has_supported_file:
                 event.acceptProposedAction()
@@ -3701,116 +4247,170 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
     def dropEvent(self, event: QDropEvent):
         """Обработка сброса файлов"""
         if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            supported_extensions = ['.xlsx', '.docx', '.doc', '.txt']
-            files_added = 0
-            
-            for url in urls:
-                file_path = url.toLocalFile()
-                if file_path and os.path.isfile(file_path):
-                    ext = os.path.splitext(file_path)[1].lower()
-                    if ext in supported_extensions:
-                        if file_path not in self.input_files:
-                            self.input_files[file_path] = 1
-                            self.last_input_file = file_path  # Сохраняем последний добавленный файл
-                            files_added += 1
-            
-            if files_added > 0:
-                self.update_listbox()
-                self.update_output_filename()
-                # Показываем уведомление в status bar (автоматически исчезнет через 5 секунд)
-                self.statusBar().showMessage(
-                    f"✓ Добавлено файлов: {files_added}. Используйте Ctrl+R для запуска обработки.",
-                    5000  # 5 секунд
-                )
+            # Сначала дешевые проверки строки, обращение к диску - только для подходящих файлов
+            candidates = list(dict.fromkeys(
+                file_path for file_path in (url.toLocalFile() for url in event.mimeData().urls())
+                if file_path.lower().endswith(_SUPPORTED_EXTS) and file_path not in self.input_files
+            ))
+            
+            worker_busy = self.file_check_worker is not None and self.file_check_worker.isRunning()
+            if len(candidates) >= _DROP_SYNC_LIMIT and not worker_busy:
+                # Много файлов - stat() выполняется в фоне, чтобы не замораживать окно
+                self.statusBar().showMessage(f"⏳ Проверка файлов: {len(candidates)}...")
+                self.file_check_worker = FileCheckWorker(candidates)
+                self.file_check_worker.finished.connect(self.on_dropped_files_checked)
+                self.file_check_worker.start()
             else:
-                QMessageBox.warning(
-                    self,
-                    "Неподдерживаемый формат",
-                    "Поддерживаются только файлы:\n"
-                    "XLSX, DOCX, DOC, TXT"
-                )
+                self.on_dropped_files_checked([path for path in candidates if os.path.isfile(path)])
             
             event.acceptProposedAction()
         else:
             event.ignore()
 
+    def on_dropped_files_checked(self, file_paths: List[str]):
+        """Добавляет проверенные перетащенные файлы в список (в GUI потоке)"""
+        files_added = 0
+        for file_path in file_paths:
+            if file_path not in self.input_files:
+                self.input_files[file_path] = 1
+                self.last_input_file = file_path  # Сохраняем последний добавленный файл
+                files_added += 1
+        
+        if files_added > 0:
+            self.update_listbox()
+            self.update_output_filename()
+            # Показываем уведомление в status bar (автоматически исчезнет через 5 секунд)
+            self.statusBar().showMessage(
+                f"✓ Добавлено файлов: {files_added}. Используйте Ctrl+R для запуска обработки.",
+                5000  # 5 секунд
+            )
+        else:
+            self.statusBar().clearMessage()
+            QMessageBox.warning(
+                self,
+                "Неподдерживаемый формат",
+                "Поддерживаются только файлы:\n"
+                "XLSX, DOCX, DOC, TXT"
+            )
+
     # ==================== Управление представлением ====================
 
     def apply_scale_factor(self):
         """Применяет текущий коэффициент масштабирования"""
-        font_size = max(8, int(round(self.base_font_size * self.scale_factor)))
-        font = QFont(get_system_font(), font_size)
-        
-        # Применяем масштаб глобально через QApplication (для всех новых виджетов)
-        if self.app:
-            self.app.setFont(font)
-        
-        # Применяем к главному окну
-        self.setFont(font)
-        
-        # Применяем рекурсивно ко всем дочерним виджетам (кроме меню)
-        self._apply_font_recursive(self, font)
-        
-        # Применяем шрифт для меню - на 20% крупнее основного интерфейса, но не меньше 90%
-        # Если основной интерфейс 70%, то меню 90%; если 80%, то меню 100%
-        from PySide6.QtWidgets import QMenu, QMenuBar
-        menubar = self.menuBar()
-        if menubar:
-            # Меню всегда на 0.2 (20%) крупнее, но минимум 0.9 (90%)
-            menu_scale = max(self.scale_factor + 0.2, 0.9)
-            
-            menu_base_size = 9  # Базовый размер для меню
-            menu_font_size = max(7, int(round(menu_base_size * menu_scale)))
-            menu_font = QFont(get_system_font(), menu_font_size)
-            
-            # Устанавливаем шрифт для самого menubar (названия "Файл", "Вид" и т.д.)
-            menubar.setFont(menu_font)
-            
-            # ПРИНУДИТЕЛЬНО через stylesheet - это единственный способ изменить шрифт menubar
-            menubar_style = f"QMenuBar {{ font-size: {menu_font_size}pt; font-family: '{get_system_font()}'; }}"
-            menubar_style += f"QMenuBar::item {{ font-size: {menu_font_size}pt; font-family: '{get_system_font()}'; }}"
-            menubar.setStyleSheet(menubar_style)
-            
-            # Устанавливаем шрифт для выпадающих меню
-            for menu in self.findChildren(QMenu):
-                menu.setFont(menu_font)
-        
-        # Обновляем размеры виджетов, заданные в пикселях
-        self._update_widget_sizes()
+        # Отключаем перерисовку на время изменения шрифтов и размеров,
+        # чтобы окно перестроилось один раз, а не после каждого виджета
+        self.setUpdatesEnabled(False)
+        try:
+            font_size = max(8, int(round(self.base_font_size * self.scale_factor)))
+            font = QFont(get_system_font(), font_size)
+        
+            # Применяем масштаб глобально через QApplication (для всех новых виджетов)
+            if self.app:
+                self.app.setFont(font)
+        
+            # Применяем к главному окну
+            self.setFont(font)
+        
+            # Один обход дерева виджетов вместо отдельного findChildren() на каждый тип
+            children = self._collect_scalable_children()
+        
+            # Применяем ко всем дочерним виджетам (кроме меню)
+            self._apply_font_to_widgets(self, font, children['widgets'])
+        
+            # Применяем шрифт для меню - на 20% крупнее основного интерфейса, но не меньше 90%
+            # Если основной интерфейс 70%, то меню 90%; если 80%, то меню 100%
+            menubar = self.menuBar()
+            if menubar:
+                # Меню всегда на 0.2 (20%) крупнее, но минимум 0.9 (90%)
+                menu_scale = max(self.scale_factor + 0.2, 0.9)
+            
+                menu_base_size = 9  # Базовый размер для меню
+                menu_font_size = max(7, int(round(menu_base_size * menu_scale)))
+                menu_font = QFont(get_system_font(), menu_font_size)
+            
+                # ПРИНУДИТЕЛЬНО через stylesheet - это единственный способ изменить шрифт menubar.
+                # setStyleSheet сбрасывает кэш стилей, поэтому вызываем только при смене размера
+                menubar_style = _MENUBAR_QSS_TMPL.format(size=menu_font_size, family=get_system_font())
+                if menubar_style != self._menubar_style:
+                    # Устанавливаем шрифт для самого menubar (названия "Файл", "Вид" и т.д.)
+                    menubar.setFont(menu_font)
+                    menubar.setStyleSheet(menubar_style)
+                    self._menubar_style = menubar_style
+            
+                # Устанавливаем шрифт для выпадающих меню
+                for menu in children['menus']:
+                    menu.setFont(menu_font)
+        
+            # Обновляем размеры виджетов, заданные в пикселях
+            self._update_widget_sizes(children)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
         
         self.update_scale_actions()
     
-    def _apply_font_recursive(self, widget, font):
-        """Рекурсивно применяет шрифт ко всем дочерним виджетам"""
-        from PySide6.QtWidgets import QMenu, QMenuBar
-        
-        # Применяем к текущему виджету
-        current_font = widget.font()
-        # Сохраняем семейство шрифта, если оно было специально задано
-        if current_font.family() != font.family() and current_font.family() != get_system_font():
-            # Используем существующее семейство, но обновляем размер
-            current_font.setPointSize(font.pointSize())
-            widget.setFont(current_font)
-        else:
-            widget.setFont(font)
+    def _collect_scalable_children(self) -> Dict[str, list]:
+        """
+        Собирает дочерние объекты окна по типам за один обход дерева
+
+        Returns:
+            Dict[str, list]: Списки 'widgets' (все виджеты, кроме меню), 'menus',
+                'buttons', 'line_edits', 'spin_boxes' и 'layouts'
+        """
+        children = {
+            'widgets': [], 'menus': [], 'buttons': [],
+            'line_edits': [], 'spin_boxes': [], 'layouts': [],
+        }
+        for obj in self.findChildren(QObject):
+            # Точный тип из словаря вместо цепочки isinstance() через границу PySide
+            bucket = _SCALABLE_BUCKETS.get(type(obj))
+            if obj.isWidgetType():
+                # Меню сохраняют собственный размер шрифта
+                if bucket == 'menus':
+                    children['menus'].append(obj)
+                    continue
+                if bucket == 'menubar':
+                    continue
+                children['widgets'].append(obj)
+            if bucket is not None:
+                children[bucket].append(obj)
+        return children
+    
+    def _apply_font_to_widgets(self, widget, font, children: List[QWidget]):
+        """
+        Применяет шрифт к виджету и его дочерним виджетам
+
+        Обход без рекурсии: дочерние виджеты уже собраны одним проходом по дереву.
+
+        Args:
+            widget: Корневой виджет
+            font: Шрифт для применения
+            children: Дочерние виджеты без меню (из _collect_scalable_children)
+        """
+        # Значения, одинаковые для всех виджетов, вычисляем один раз
+        target_family = font.family()
+        system_family = get_system_font()
+        point_size = font.pointSize()
         
-        # Применяем рекурсивно ко всем дочерним виджетам
-        for child in widget.findChildren(QWidget):
-            # ПРОПУСКАЕМ меню - они должны сохранять системный размер шрифта
-            if isinstance(child, (QMenu, QMenuBar)):
-                continue
-                
+        # Применяем к текущему виджету и ко всем дочерним (меню уже исключены)
+        for child in (widget, *children):
             child_font = child.font()
-            if child_font.family() != font.family() and child_font.family() != get_system_font():
-                # Сохраняем специальное семейство шрифта, но обновляем размер
-                child_font.setPointSize(font.pointSize())
+            child_family = child_font.family()
+            # Сохраняем семейство шрифта, если оно было специально задано
+            if child_family != target_family and child_family != system_family:
+                # Используем существующее семейство, но обновляем размер
+                child_font.setPointSize(point_size)
                 child.setFont(child_font)
             else:
                 child.setFont(font)
     
-    def _update_widget_sizes(self):
-        """Обновляет размеры виджетов в соответствии с масштабом"""
+    def _update_widget_sizes(self, children: Dict[str, list]):
+        """
+        Обновляет размеры виджетов в соответствии с масштабом
+
+        Args:
+            children: Дочерние объекты окна по типам (из _collect_scalable_children)
+        """
         # Базовые размеры (для масштаба 1.0)
         base_button_height = 32
         base_input_height = 28
@@ -3834,34 +4434,29 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             self.log_text.setMinimumHeight(int(100 * self.scale_factor))
         
         # Обновляем размеры всех кнопок
-        for button in self.findChildren(QPushButton):
+        for button in children['buttons']:
             button.setMinimumHeight(scaled_button_height)
             button.setMaximumHeight(scaled_button_height + 10)
         
         # Обновляем размеры полей ввода
-        for line_edit in self.findChildren(QLineEdit):
+        for line_edit in children['line_edits']:
             line_edit.setMinimumHeight(scaled_input_height)
             line_edit.setMaximumHeight(scaled_input_height + 10)
         
         # Обновляем размеры спинбоксов
-        for spin_box in self.findChildren(QSpinBox):
+        for spin_box in children['spin_boxes']:
             spin_box.setMinimumHeight(scaled_input_height)
             spin_box.setMaximumHeight(scaled_input_height + 10)
         
-        # Обновляем интервалы в layouts
-        for layout in self.findChildren(QVBoxLayout):
-            if layout:
-                layout.setSpacing(scaled_spacing)
-        
-        for layout in self.findChildren(QHBoxLayout):
-            if layout:
+        # Обновляем интервалы в layouts (setSpacing всегда инвалидирует layout - пропускаем неизменные)
+        for layout in children['layouts']:
+            if layout.spacing() != scaled_spacing:
                 layout.setSpacing(scaled_spacing)
         
         # Принудительно обновляем геометрию
         self.updateGeometry()
         # НЕ вызываем adjustSize() - это автоматически уменьшает окно!
         # Размер окна должен определяться config_qt.json, а не содержимым
-        QApplication.processEvents()
 
     def update_scale_actions(self):
         """Обновляет состояние пунктов меню масштаба"""
@@ -3870,24 +4465,36 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         for factor, action in self.scale_actions.items():
             if action is None:
                 continue
-            blocked = action.blockSignals(True)
-            action.setChecked(abs(self.scale_factor - factor) < 0.001)
-            action.blockSignals(blocked)
+            checked = factor == self.scale_factor
+            if action.isChecked() != checked:
+                blocked = action.blockSignals(True)
+                action.setChecked(checked)
+                action.blockSignals(blocked)
 
     def set_scale_factor(self, factor: float):
         """Устанавливает масштаб интерфейса"""
-        if factor not in self.scale_levels:
+        if factor not in self._scale_index:
             factor = min(self.scale_levels, key=lambda x: abs(x - factor))
-        if abs(self.scale_factor - factor) < 0.001:
+        if factor == self.scale_factor:
             self.update_scale_actions()
             return
         self.scale_factor = factor
-        self.apply_scale_factor()
-        self.save_ui_preferences()
+        self._font_cache.clear()
+        # Кэшированные диалоги пересоздаются с новым масштабом при следующем открытии
+        if self._db_view_dialog is not None:
+            self._db_view_dialog.deleteLater()
+            self._db_view_dialog = None
+        if self._dragdrop_help_dialog is not None:
+            self._dragdrop_help_dialog.deleteLater()
+            self._dragdrop_help_dialog = None
+        # Отметка в меню обновляется сразу, перестроение окна - после паузы
+        self.update_scale_actions()
+        self._zoom_timer.start()
 
     def _current_scale_index(self) -> int:
-        if self.scale_factor in self.scale_levels:
-            return self.scale_levels.index(self.scale_factor)
+        index = self._scale_index.get(self.scale_factor)
+        if index is not None:
+            return index
         closest = min(range(len(self.scale_levels)), key=lambda i: abs(self.scale_levels[i] - self.scale_factor))
         self.scale_factor = self.scale_levels[closest]
         return closest
@@ -3962,19 +4569,34 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             self.ai_auto_classify = False
         self.apply_view_mode()
 
+    def _build_expert_section(self):
+        """Строит содержимое экспертной секции и приводит его к текущему масштабу"""
+        gui_sections_qt.build_expert_tools_section(self, self.expert_section)
+
+        # apply_scale_factor() уже отработал до постройки секции - применяем размеры
+        # в пикселях (высота кнопок, отступы layouts) и к ее виджетам. Сначала полируем
+        # новые виджеты: иначе min-height из стилей темы перезапишет размеры при первом показе
+        for widget in self.expert_section.findChildren(QWidget):
+            widget.ensurePolished()
+        self._update_widget_sizes(self._collect_scalable_children())
+
     def apply_view_mode(self, initial: bool = False):
         simple = self.current_view_mode == "simple"
         expert = self.current_view_mode == "expert"
 
+        # Сеттеры вызываются только при реальном изменении состояния
         if hasattr(self, "comparison_section") and self.comparison_section:
-            self.comparison_section.setVisible(not simple)
+            _set_visible(self.comparison_section, not simple)
         if hasattr(self, "log_section") and self.log_section:
-            self.log_section.setVisible(expert)
+            _set_visible(self.log_section, expert)
         if hasattr(self, "expert_section") and self.expert_section:
-            self.expert_section.setVisible(expert)
+            if expert and self.expert_section.layout() is None:
+                # Содержимое экспертной секции строится только при первом показе
+                self._build_expert_section()
+            _set_visible(self.expert_section, expert)
 
         if self.db_menu is not None:
-            self.db_menu.menuAction().setVisible(not simple)
+            _set_visible(self.db_menu.menuAction(), not simple)
         
         # PDF поиск - меню доступно всегда, но AI функции только для разблокированных экспертов
         if hasattr(self, 'pdf_search_menu') and self.pdf_search_menu is not None:
@@ -3992,7 +4614,7 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         if hasattr(self, 'global_search_menu'):
             is_advanced_or_expert = self.current_view_mode in ["advanced", "expert"]
             # Скрываем меню в простом режиме
-            self.global_search_menu.menuAction().setVisible(is_advanced_or_expert)
+            _set_visible(self.global_search_menu.menuAction(), is_advanced_or_expert)
             
             # Поле ввода активно только если разблокировано И режим подходящий
             if hasattr(self, 'global_search_input'):
@@ -4008,26 +4630,17 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
                 self.global_search_menu.setToolTip("Глобальный поиск доступен в расширенном и экспертном режимах")
 
         if self.mode_label is not None:
-            mode_titles = {
-                "simple": ("Режим: Простой", "#fab387"),
-                "advanced": ("Режим: Расширенный", "#89b4fa"),
-                "expert": ("Режим: Эксперт", "#f38ba8"),
-            }
-            text, color = mode_titles.get(self.current_view_mode, ("Режим: Неизвестно", "#cdd6f4"))
-            self.mode_label.setText(text)
-            self.mode_label.setStyleSheet(f"QLabel {{ color: {color}; font-weight: bold; }}")
+            text = _MODE_TITLES.get(self.current_view_mode, "Режим: Неизвестно")
+            if self.mode_label.text() != text:
+                self.mode_label.setText(text)
+            # Цвет задается селектором QLabel#modeLabel[mode=...] в _STATUS_LABELS_QSS
+            _set_style_state(self.mode_label, "mode", self.current_view_mode)
 
         if self.timestamp_checkbox is not None:
-            self.timestamp_checkbox.blockSignals(True)
-            self.timestamp_checkbox.setEnabled(expert)
-            self.timestamp_checkbox.setChecked(self.log_with_timestamps if expert else False)
-            self.timestamp_checkbox.blockSignals(False)
+            _set_checkbox_state(self.timestamp_checkbox, expert, self.log_with_timestamps if expert else False)
 
         if self.auto_open_output_checkbox is not None:
-            self.auto_open_output_checkbox.blockSignals(True)
-            self.auto_open_output_checkbox.setEnabled(expert)
-            self.auto_open_output_checkbox.setChecked(self.auto_open_output if expert else False)
-            self.auto_open_output_checkbox.blockSignals(False)
+            _set_checkbox_state(self.auto_open_output_checkbox, expert, self.auto_open_output if expert else False)
 
         self.update_mode_action_permissions()
         self.update_view_mode_actions()
@@ -4035,18 +4648,15 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         # При смене режима обновляем размер окна
         if not initial:
             self._apply_window_size_for_mode(self.current_view_mode)
-            self.save_ui_preferences()
 
     def on_toggle_log_timestamps(self, state: int):
         self.log_with_timestamps = bool(state)
-        self.save_ui_preferences()
         if self.log_text:
             message = "🕒 Временные метки лога включены" if self.log_with_timestamps else "🕒 Временные метки лога отключены"
             self.log_text.append(message)
 
     def on_toggle_auto_open_output(self, state: int):
         self.auto_open_output = bool(state)
-        self.save_ui_preferences()
         if self.log_text:
             message = "📂 Автооткрытие папки результата включено" if self.auto_open_output else "📂 Автооткрытие папки результата отключено"
             self.log_text.append(message)
@@ -4075,12 +4685,9 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             # Для отключения нужен перезапуск приложения
             if self.log_text:
                 self.log_text.append("⚠️ Для отключения требуется перезапуск приложения")
-        
-        self.save_ui_preferences()
     
     def open_interactive_cli(self):
         """Открывает интерактивную командную строку"""
-        from PySide6.QtWidgets import QDialog
         from .cli_interactive import InteractiveCLI
         
         # Создаем диалог
@@ -4089,7 +4696,6 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         dialog.resize(900, 600)
         
         # Создаем layout
-        from PySide6.QtWidgets import QVBoxLayout
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(10, 10, 10, 10)
         
@@ -4129,7 +4735,6 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             from .pdf_exporter import export_bom_to_pdf
             
             # Показываем диалог выбора места сохранения
-            from PySide6.QtWidgets import QFileDialog
             pdf_path, _ = QFileDialog.getSaveFileName(
                 self,
                 "Сохранить PDF",
@@ -4199,7 +4804,6 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
     def on_toggle_auto_pdf_export(self, state: int):
         """Включение/выключение автоматического экспорта в PDF"""
         self.auto_export_pdf = bool(state)
-        self.save_ui_preferences()
         if self.log_text:
             message = "📄 Автоматический экспорт в PDF включен" if self.auto_export_pdf else "📄 Автоматический экспорт в PDF отключен"
             self.log_text.append(message)
@@ -4207,7 +4811,6 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
     def on_toggle_ai_classifier(self, state: int):
         """Включение/выключение AI-подсказок"""
         self.ai_classifier_enabled = bool(state)
-        self.save_ui_preferences()
         
         # Обновляем статус
         self.update_ai_status()
@@ -4218,8 +4821,7 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             
             if self.ai_classifier_enabled:
                 # Проверяем наличие API ключа
-                from .ai_classifier_qt import AIClassifierSettings
-                settings = AIClassifierSettings()
+                settings = self._get_ai_settings()
                 api_key = settings.get_api_key()
                 
                 if not api_key:
@@ -4233,8 +4835,7 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         
         # Если пользователь пытается включить
         if checked:
-            from .ai_classifier_qt import AIClassifierSettings
-            settings = AIClassifierSettings()
+            settings = self._get_ai_settings()
             
             if not settings.is_enabled():
                 # AI отключен - показываем предупреждение
@@ -4277,7 +4878,6 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         
         # Если дошли до сюда, значит можно изменить состояние
         self.ai_auto_classify = checked
-        self.save_ui_preferences()
         
         if self.log_text:
             if self.ai_auto_classify:
@@ -4314,7 +4914,7 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         provider_combo.addItems(["Anthropic Claude", "OpenAI GPT", "Ollama (локальный)"])
         form.addRow("Провайдер AI:", provider_combo)
         
-        # Загружаем текущие настройки
+        # Загружаем текущие настройки (заново - конфиг будет перезаписан целиком)
         settings = AIClassifierSettings()
         current_provider = settings.get_provider()
         provider_map = {
@@ -4396,6 +4996,8 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             }
             
             if settings.save_settings(new_settings):
+                # Сохраненный экземпляр становится актуальным кэшем
+                self._ai_settings = settings
                 if self.log_text:
                     self.log_text.append("✅ Настройки AI сохранены")
                 
@@ -4404,17 +5006,27 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
             else:
                 QMessageBox.warning(self, "Ошибка", "Не удалось сохранить настройки AI")
     
+    def _get_ai_settings(self):
+        """
+        Возвращает настройки AI классификатора (читаются из конфига один раз)
+
+        Кэш обновляется при сохранении настроек в open_ai_settings.
+        """
+        if self._ai_settings is None:
+            from .ai_classifier_qt import AIClassifierSettings
+            self._ai_settings = AIClassifierSettings()
+        return self._ai_settings
+
     def update_ai_status(self):
         """Обновляет статус AI в UI"""
         if not hasattr(self, 'ai_status_label'):
             return
         
-        from .ai_classifier_qt import AIClassifierSettings
-        settings = AIClassifierSettings()
+        settings = self._get_ai_settings()
         
         if not settings.is_enabled():
             self.ai_status_label.setText("Статус: ⚪ Отключен")
-            self.ai_status_label.setStyleSheet("color: #6c7086;")
+            _set_style_state(self.ai_status_label, "aiStatus", "off")
             # Чекбокс остается активным, чтобы показать подсказку при клике
             return
         
@@ -4423,35 +5035,25 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
         
         if not api_key:
             self.ai_status_label.setText(f"Статус: 🟡 Не настроен")
-            self.ai_status_label.setStyleSheet("color: #fab387;")
+            _set_style_state(self.ai_status_label, "aiStatus", "warn")
             # Чекбокс остается активным, чтобы показать подсказку при клике
         else:
-            provider_names = {
-                "anthropic": "Claude",
-                "openai": "GPT",
-                "ollama": "Ollama"
-            }
-            provider_name = provider_names.get(provider, provider)
+            provider_name = _PROVIDER_NAMES.get(provider, provider)
             self.ai_status_label.setText(f"Статус: 🟢 Готов ({provider_name})")
-            self.ai_status_label.setStyleSheet("color: #a6e3a1;")
+            _set_style_state(self.ai_status_label, "aiStatus", "ok")
     
     def _open_file(self, file_path: str):
         """Открывает файл в системном приложении"""
         try:
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
+            elif _IS_MAC:  # macOS
                 subprocess.Popen(['open', file_path])
             else:  # Linux
                 subprocess.Popen(['xdg-open', file_path])
         except Exception as e:
             QMessageBox.warning(self, "Ошибка", f"Не удалось открыть файл:\n{e}")
 
-    def save_ui_preferences(self):
-        """Настройки UI НЕ сохраняются - приложение всегда открывается с настройками из config_qt.json"""
-        # Метод оставлен для совместимости, но ничего не делает
-        pass
-
     def reveal_in_file_manager(self, target_path: str, select: bool = True) -> bool:
         """Открывает системный проводник и при необходимости выделяет файл."""
         if not target_path:
@@ -4459,29 +5061,47 @@ Copyright © 2025 Куреин М.Н. / Kurein M.N.<br><br>
 
         try:
             abs_path = os.path.abspath(target_path)
-            system = platform.system()
 
-            if system == 'Windows':
-                if select and os.path.isfile(abs_path):
+            # Один stat() вместо отдельных isfile()/isdir() в каждой ветке
+            try:
+                mode = os.stat(abs_path).st_mode
+            except OSError:
+                mode = 0
+            is_file = stat.S_ISREG(mode)
+            folder = abs_path if stat.S_ISDIR(mode) else os.path.dirname(abs_path)
+
+            if _IS_WINDOWS:
+                if select and is_file:
+                    # Строка, а не список: list2cmdline заключил бы в кавычки весь аргумент
+                    # "/select,путь с пробелами", а explorer такую форму не разбирает
                     subprocess.Popen(f'explorer /select,"{abs_path}"')
                 else:
-                    folder = abs_path if os.path.isdir(abs_path) else os.path.dirname(abs_path)
                     subprocess.Popen(['explorer', folder])
-            elif system == 'Darwin':
-                if select and os.path.isfile(abs_path):
+            elif _IS_MAC:
+                if select and is_file:
                     subprocess.Popen(['open', '-R', abs_path])
                 else:
-                    folder = abs_path if os.path.isdir(abs_path) else os.path.dirname(abs_path)
                     subprocess.Popen(['open', folder])
             else:
-                folder = abs_path if os.path.isdir(abs_path) else os.path.dirname(abs_path)
                 subprocess.Popen(['xdg-open', folder])
 
             return True
         except Exception as e:
-            print(f"⚠️ Не удалось открыть проводник: {e}")
+            logger.warning("Не удалось открыть проводник: %s", e)
             return False
 
+    def reveal_in_file_manager_async(self, target_path: str, select: bool = True):
+        """
+        Открывает проводник из пула потоков, не блокируя GUI
+
+        Запуск Explorer/Finder может занимать сотни миллисекунд (особенно для
+        сетевых путей). reveal_in_file_manager() не трогает виджеты, поэтому
+        безопасно вызывается из рабочего потока.
+        """
+        QThreadPool.globalInstance().start(
+            lambda: self.reveal_in_file_manager(target_path, select=select)
+        )
+
 
 def main():
     """Точка входа для PySide6 приложения"""
@@ -4495,18 +5115,16 @@ def main():
     # Устанавливаем переменные окружения ДО импорта/создания QApplication
     # Это критично для правильной работы на Retina дисплеях
     import os as os_env
-    if platform.system() == 'Darwin':  # macOS
+    if _IS_MAC:  # macOS
         # Включаем автоматическое масштабирование для Retina
-        os_env.environ['QT_AUTO_SCREEN_SCALE_FACTOR'] = '1'
-        os_env.environ['QT_ENABLE_HIGHDPI_SCALING'] = '1'
+        # (значения, заданные скриптом запуска, не перезаписываем)
+        os_env.environ.setdefault('QT_AUTO_SCREEN_SCALE_FACTOR', '1')
+        os_env.environ.setdefault('QT_ENABLE_HIGHDPI_SCALING', '1')
         # Для Qt 6
-        os_env.environ['QT_SCALE_FACTOR_ROUNDING_POLICY'] = 'PassThrough'
-    
-    # КРИТИЧНО: эти атрибуты должны быть установлены ДО создания QApplication!
-    # Без них на macOS Retina шрифты будут выглядеть в 2 раза меньше
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        os_env.environ.setdefault('QT_SCALE_FACTOR_ROUNDING_POLICY', 'PassThrough')
     
+    # В Qt 6 масштабирование HighDPI включено всегда (AA_EnableHighDpiScaling и
+    # AA_UseHighDpiPixmaps устарели и ничего не делают) - задаем только округление.
     # Для Qt 6: используем PassThrough для правильного масштабирования на Retina
     try:
         if hasattr(Qt, 'HighDpiScaleFactorRoundingPolicy'):
@@ -4526,11 +5144,11 @@ def main():
     # ========== УСТАНОВКА ГЛОБАЛЬНОГО ШРИФТА ДЛЯ MACOS RETINA ==========
     # Устанавливаем шрифт ДО создания виджетов, чтобы все виджеты
     # использовали правильный размер с самого начала
-    if platform.system() == 'Darwin':  # macOS
+    if _IS_MAC:  # macOS
         # Определяем размер для Retina (сопоставимый с другими macOS приложениями)
         try:
-            screens = QGuiApplication.screens()
-            if screens and screens[0].devicePixelRatio() >= 2:
+            screen = QGuiApplication.primaryScreen()
+            if screen is not None and screen.devicePixelRatio() >= 2:
                 # Retina: используем 13pt (как в стандартных macOS приложениях)
                 base_size = 13
             else:
@@ -4539,10 +5157,11 @@ def main():
             base_size = 13  # Для надежности
         
         # Устанавливаем глобальный шрифт для приложения
-        app_font = QFont(get_system_font(), base_size)
+        font_family = get_system_font()
+        app_font = QFont(font_family, base_size)
         app.setFont(app_font)
         
-        print(f"🔤 macOS: Установлен глобальный шрифт {get_system_font()} размером {base_size}pt")
+        logger.info("macOS: установлен глобальный шрифт %s размером %dpt", font_family, base_size)
     # ==================================================================
 
     # Создаем и показываем главное окно
@@ -10,24 +10,49 @@
 - Футер
 """
 
-from typing import TYPE_CHECKING
-from datetime import datetime
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Optional
 from PySide6.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
-    QPushButton, QLineEdit, QSpinBox, QCheckBox, QListWidget, QTextEdit, QWidget
+    QPushButton, QLineEdit, QSpinBox, QCheckBox, QListWidget, QPlainTextEdit, QWidget
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QTimer
 
 if TYPE_CHECKING:
     from .gui_qt import BOMCategorizerMainWindow
 
-from .component_database import get_database_stats, get_database_path
+from .component_database import get_database_path
+
+# Максимум строк в логе выполнения (ограничивает память и время перекомпоновки)
+_LOG_MAX_LINES = 10000
+
+# Ширина кнопок в третьем столбце форм ("Выбрать...", "Применить")
+_ROW_BUTTON_WIDTH = 100
+
+
+def _pick_button(window: 'BOMCategorizerMainWindow', callback) -> QPushButton:
+    """Создает кнопку "Выбрать..." для строки сетки (блокируется вместе с формой)"""
+    button = QPushButton("Выбрать...")
+    button.setFixedWidth(_ROW_BUTTON_WIDTH)
+    button.clicked.connect(callback)
+    window.lockable_widgets.append(button)
+    return button
+
+
+def _add_grid_row(grid: QGridLayout, row: int, text: str, field: QWidget, button: Optional[QWidget] = None) -> None:
+    """Добавляет строку сетки: подпись, поле и (при наличии) кнопку"""
+    grid.addWidget(QLabel(text), row, 0, Qt.AlignLeft)
+    grid.addWidget(field, row, 1)
+    if button is not None:
+        grid.addWidget(button, row, 2)
 
 
 def create_main_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     """Создает секцию основных настроек"""
     group = QGroupBox("Основные настройки")
+    # Перерисовка один раз после сборки секции, а не после каждого addWidget
+    group.setUpdatesEnabled(False)
     layout = QVBoxLayout()
 
     # Кнопки управления файлами
@@ -57,6 +82,10 @@ def create_main_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
 
     window.files_list = QListWidget()
     window.files_list.setMaximumHeight(100)
+    # Строки одной высоты: высота считается один раз, раскладка большого списка - порциями
+    window.files_list.setUniformItemSizes(True)
+    window.files_list.setLayoutMode(QListWidget.Batched)
+    window.files_list.setBatchSize(100)
     window.files_list.itemSelectionChanged.connect(window.on_file_selected)
     window.lockable_widgets.append(window.files_list)
     layout.addWidget(window.files_list)
@@ -70,13 +99,8 @@ def create_main_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     
     row = 0
 
-    # Количество экземпляров
-    label = QLabel("Количество экземпляров:")
-    label.setMinimumWidth(180)
-    grid.addWidget(label, row, 0, Qt.AlignLeft)
-
-    mult_widget = QWidget()
-    mult_layout = QHBoxLayout(mult_widget)
+    # Количество экземпляров: вложенный layout прямо в ячейке сетки, без промежуточного QWidget
+    mult_layout = QHBoxLayout()
     mult_layout.setContentsMargins(0, 0, 0, 0)
     mult_layout.setSpacing(6)
 
@@ -90,7 +114,7 @@ def create_main_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     mult_layout.addWidget(window.multiplier_spin)
 
     apply_mult_btn = QPushButton("Применить")
-    apply_mult_btn.setFixedWidth(100)
+    apply_mult_btn.setFixedWidth(_ROW_BUTTON_WIDTH)
     apply_mult_btn.clicked.connect(window.on_multiplier_changed)
     window.lockable_widgets.append(apply_mult_btn)
     mult_layout.addWidget(apply_mult_btn)
@@ -110,52 +134,31 @@ def create_main_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
 
     mult_layout.addStretch()
 
-    grid.addWidget(mult_widget, row, 1)
+    grid.addWidget(QLabel("Количество экземпляров:"), row, 0, Qt.AlignLeft)
+    grid.addLayout(mult_layout, row, 1)
     row += 1
 
     # Листы Excel
-    label = QLabel("Листы (через запятую):")
-    label.setMinimumWidth(180)
-    grid.addWidget(label, row, 0, Qt.AlignLeft)
-
     window.sheet_entry = QLineEdit()
     window.sheet_entry.setPlaceholderText("Оставьте пустым для всех листов")
     window.lockable_widgets.append(window.sheet_entry)
-    grid.addWidget(window.sheet_entry, row, 1)
+    _add_grid_row(grid, row, "Листы (через запятую):", window.sheet_entry)
     row += 1
 
     # Выходной файл XLSX
-    label = QLabel("Выходной XLSX:")
-    label.setMinimumWidth(180)
-    grid.addWidget(label, row, 0, Qt.AlignLeft)
-
     window.output_entry = QLineEdit()
     window.output_entry.setText(window.output_xlsx)
     window.lockable_widgets.append(window.output_entry)
-    grid.addWidget(window.output_entry, row, 1)
-
-    pick_output_btn = QPushButton("Выбрать...")
-    pick_output_btn.setFixedWidth(100)
-    pick_output_btn.clicked.connect(window.on_pick_output)
-    window.lockable_widgets.append(pick_output_btn)
-    grid.addWidget(pick_output_btn, row, 2)
+    _add_grid_row(grid, row, "Выходной XLSX:", window.output_entry,
+                  _pick_button(window, window.on_pick_output))
     row += 1
 
     # Папка для TXT
-    label = QLabel("Папка для TXT:")
-    label.setMinimumWidth(180)
-    grid.addWidget(label, row, 0, Qt.AlignLeft)
-
     window.txt_entry = QLineEdit()
     window.txt_entry.setPlaceholderText("Опционально")
     window.lockable_widgets.append(window.txt_entry)
-    grid.addWidget(window.txt_entry, row, 1)
-
-    pick_txt_btn = QPushButton("Выбрать...")
-    pick_txt_btn.setFixedWidth(100)
-    pick_txt_btn.clicked.connect(window.on_pick_txt_dir)
-    window.lockable_widgets.append(pick_txt_btn)
-    grid.addWidget(pick_txt_btn, row, 2)
+    _add_grid_row(grid, row, "Папка для TXT:", window.txt_entry,
+                  _pick_button(window, window.on_pick_txt_dir))
 
     layout.addLayout(grid)
 
@@ -177,7 +180,7 @@ def create_main_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     action_layout.addWidget(interactive_btn, 1)
 
     export_pdf_button = QPushButton("📄 Экспорт в PDF")
-    export_pdf_button.setObjectName("exportPdfButton")
+    export_pdf_button.setObjectName("exportPdfButton")  # стиль - _EXPORT_PDF_BUTTON_QSS (gui_qt)
     export_pdf_button.setMinimumHeight(36)
     export_pdf_button.clicked.connect(window.export_last_result_to_pdf)
     export_pdf_button.setToolTip(
@@ -186,35 +189,20 @@ def create_main_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
         "• Титульная страница со сводкой\n"
         "• Удобно для печати и отправки"
     )
-    export_pdf_button.setStyleSheet("""
-        QPushButton {
-            background-color: #f38ba8;
-            color: white;
-            border: none;
-            border-radius: 5px;
-            padding: 8px 15px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #f5c2e7;
-        }
-        QPushButton:disabled {
-            background-color: #6c7086;
-            color: #45475a;
-        }
-    """)
     window.lockable_widgets.append(export_pdf_button)
     action_layout.addWidget(export_pdf_button, 1)
 
     layout.addLayout(action_layout)
 
     group.setLayout(layout)
+    group.setUpdatesEnabled(True)
     return group
 
 
 def create_comparison_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     """Создает секцию сравнения файлов"""
     group = QGroupBox("Сравнение BOM файлов")
+    group.setUpdatesEnabled(False)
     layout = QVBoxLayout()
 
     # Grid layout для выровненных полей
@@ -227,52 +215,25 @@ def create_comparison_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     row = 0
 
     # Первый файл
-    label = QLabel("Первый файл (базовый):")
-    label.setMinimumWidth(180)
-    grid.addWidget(label, row, 0, Qt.AlignLeft)
-
     window.compare_entry1 = QLineEdit()
     window.lockable_widgets.append(window.compare_entry1)
-    grid.addWidget(window.compare_entry1, row, 1)
-
-    pick_file1_btn = QPushButton("Выбрать...")
-    pick_file1_btn.setFixedWidth(100)
-    pick_file1_btn.clicked.connect(window.on_select_compare_file1)
-    window.lockable_widgets.append(pick_file1_btn)
-    grid.addWidget(pick_file1_btn, row, 2)
+    _add_grid_row(grid, row, "Первый файл (базовый):", window.compare_entry1,
+                  _pick_button(window, window.on_select_compare_file1))
     row += 1
 
     # Второй файл
-    label = QLabel("Второй файл (новый):")
-    label.setMinimumWidth(180)
-    grid.addWidget(label, row, 0, Qt.AlignLeft)
-
     window.compare_entry2 = QLineEdit()
     window.lockable_widgets.append(window.compare_entry2)
-    grid.addWidget(window.compare_entry2, row, 1)
-
-    pick_file2_btn = QPushButton("Выбрать...")
-    pick_file2_btn.setFixedWidth(100)
-    pick_file2_btn.clicked.connect(window.on_select_compare_file2)
-    window.lockable_widgets.append(pick_file2_btn)
-    grid.addWidget(pick_file2_btn, row, 2)
+    _add_grid_row(grid, row, "Второй файл (новый):", window.compare_entry2,
+                  _pick_button(window, window.on_select_compare_file2))
     row += 1
 
     # Выходной файл
-    label = QLabel("Файл результата:")
-    label.setMinimumWidth(180)
-    grid.addWidget(label, row, 0, Qt.AlignLeft)
-
     window.compare_output_entry = QLineEdit()
     window.compare_output_entry.setText(window.compare_output)
     window.lockable_widgets.append(window.compare_output_entry)
-    grid.addWidget(window.compare_output_entry, row, 1)
-
-    pick_output_btn = QPushButton("Выбрать...")
-    pick_output_btn.setFixedWidth(100)
-    pick_output_btn.clicked.connect(window.on_select_compare_output)
-    window.lockable_widgets.append(pick_output_btn)
-    grid.addWidget(pick_output_btn, row, 2)
+    _add_grid_row(grid, row, "Файл результата:", window.compare_output_entry,
+                  _pick_button(window, window.on_select_compare_output))
 
     layout.addLayout(grid)
 
@@ -284,12 +245,14 @@ def create_comparison_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     layout.addWidget(compare_btn)
 
     group.setLayout(layout)
+    group.setUpdatesEnabled(True)
     return group
 
 
 def create_log_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     """Создает секцию лога выполнения"""
     group = QGroupBox("Лог выполнения")
+    group.setUpdatesEnabled(False)
     group.setToolTip(
         "📝 <b>Лог выполнения</b><br><br>"
         "Область для отображения информации о процессе обработки файлов.<br><br>"
@@ -302,10 +265,14 @@ def create_log_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
     )
     layout = QVBoxLayout()
 
-    window.log_text = QTextEdit()
+    # QPlainTextEdit: лог - простой текст, без движка форматированного текста QTextEdit
+    window.log_text = QPlainTextEdit()
     window.log_text.setReadOnly(True)
+    # Лог только для чтения: без стека отмены, старые строки вытесняются новыми
+    window.log_text.setUndoRedoEnabled(False)
+    window.log_text.setMaximumBlockCount(_LOG_MAX_LINES)
     window.log_text.setMaximumHeight(160)
-    window.log_text.mouseDoubleClickEvent = lambda event: window.on_log_double_click(event)
+    window.log_text.mouseDoubleClickEvent = window.on_log_double_click
     window.log_text.setCursor(Qt.PointingHandCursor)
     window.log_text.setToolTip(
         "📝 <b>Лог выполнения</b><br><br>"
@@ -318,32 +285,87 @@ def create_log_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
         "• <b>F1</b> - получить подробную справку"
     )
 
-    original_append = window.log_text.append
+    # Сообщения копятся в буфере и выводятся одной вставкой не чаще раза в 50 мс,
+    # чтобы частые сообщения из обработки не перерисовывали лог на каждую строку
+    original_append = window.log_text.appendPlainText
+    original_clear = window.log_text.clear
+    original_to_plain_text = window.log_text.toPlainText
+    log_buffer = deque()
+    flush_timer = QTimer(window.log_text)
+    flush_timer.setSingleShot(True)
+    flush_timer.setInterval(50)
+
+    def flush_log():
+        if log_buffer:
+            original_append("\n".join(log_buffer))
+            log_buffer.clear()
+
+    flush_timer.timeout.connect(flush_log)
+
+    # Метка времени форматируется один раз в секунду, а не для каждого сообщения
+    last_second = None
+    last_timestamp = ""
+
+    def current_timestamp():
+        nonlocal last_second, last_timestamp
+        now = int(time.time())
+        if now != last_second:
+            last_second = now
+            last_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        return last_timestamp
 
     def append_with_mode(message):
         text = "" if message is None else str(message)
-        if getattr(window, "log_with_timestamps", False) and text.strip():
-            leading_newlines = len(text) - len(text.lstrip('\n'))
-            prefix = "\n" * leading_newlines
-            body = text.lstrip('\n')
-            timestamp = datetime.now().strftime("%H:%M:%S")
+        # isspace() и поиск первого символа после переводов строк - без копий всего сообщения
+        if window.log_with_timestamps and text and not text.isspace():
+            leading_newlines = 0
+            while text[leading_newlines] == '\n':
+                leading_newlines += 1
+            prefix = text[:leading_newlines]
+            body = text[leading_newlines:]
+            timestamp = current_timestamp()
             formatted_body = f"[{timestamp}] {body}" if body else f"[{timestamp}]"
-            original_append(prefix + formatted_body)
-        else:
-            original_append(text)
+            text = prefix + formatted_body
+        log_buffer.append(text)
+        if not flush_timer.isActive():
+            flush_timer.start()
+
+    def clear_log():
+        # Сообщения, добавленные до очистки, не должны появиться после нее
+        log_buffer.clear()
+        original_clear()
+
+    def to_plain_text_flushed():
+        flush_log()
+        return original_to_plain_text()
 
     window._log_append_original = original_append
     window.log_text.append = append_with_mode
+    window.log_text.clear = clear_log
+    window.log_text.toPlainText = to_plain_text_flushed
 
     layout.addWidget(window.log_text)
 
     group.setLayout(layout)
+    group.setUpdatesEnabled(True)
     return group
 
 
 def create_expert_tools_section(window: 'BOMCategorizerMainWindow') -> QGroupBox:
-    """Создает секцию экспертных инструментов"""
+    """
+    Создает пустую скрытую секцию экспертных инструментов
+
+    Содержимое добавляет build_expert_tools_section() при первом переходе
+    в экспертный режим, поэтому в остальных режимах виджеты секции не создаются.
+    """
     group = QGroupBox("Экспертные инструменты")
+    group.setVisible(False)
+    return group
+
+
+def build_expert_tools_section(window: 'BOMCategorizerMainWindow', group: QGroupBox) -> None:
+    """Заполняет секцию экспертных инструментов (один раз, при первом показе)"""
+    group.setUpdatesEnabled(False)
     layout = QVBoxLayout()
 
     # Чекбокс суммарной комплектации
@@ -448,13 +470,13 @@ def create_expert_tools_section(window: 'BOMCategorizerMainWindow') -> QGroupBox
     layout.addWidget(window.ai_auto_classify_checkbox)
 
     group.setLayout(layout)
-    group.setVisible(False)
-    return group
+    group.setUpdatesEnabled(True)
 
 
 def create_footer(window: 'BOMCategorizerMainWindow') -> QWidget:
     """Создает футер с информацией"""
     footer = QWidget()
+    footer.setUpdatesEnabled(False)
     layout = QVBoxLayout()
     layout.setContentsMargins(3, 3, 3, 3)
 
@@ -463,7 +485,7 @@ def create_footer(window: 'BOMCategorizerMainWindow') -> QWidget:
 
     dev_label = QLabel("Разработчик: Куреин М.Н.")
     dev_label.setProperty("class", "bold")
-    dev_label.mouseDoubleClickEvent = lambda event: window.on_developer_double_click()
+    dev_label.mouseDoubleClickEvent = window.on_developer_label_double_click
     dev_layout.addWidget(dev_label)
 
     dev_layout.addStretch()
@@ -476,40 +498,15 @@ def create_footer(window: 'BOMCategorizerMainWindow') -> QWidget:
     # Информация о БД и размере окна
     info_layout = QHBoxLayout()
 
-    # БД статистика
-    try:
-        stats = get_database_stats()
-        metadata = stats.get('metadata', {})
-        db_version = metadata.get('version', 'N/A')
-        last_updated = metadata.get('last_updated', '')
-        total_components = stats.get('total', 0)
-        
-        # Форматируем дату для отображения
-        if last_updated and last_updated != 'N/A':
-            try:
-                date_part = last_updated.split()[0]
-                version_text = f"{db_version} ({date_part})"
-            except:
-                version_text = db_version
-        else:
-            version_text = db_version
-        
-        window.db_info_label = QLabel(f"БД: {version_text} ({total_components} компонентов)")
-        
-        # Добавляем tooltip с историей
-        window.update_database_tooltip()
-        
-        # Делаем метку кликабельной
-        window.db_info_label.setCursor(Qt.PointingHandCursor)
-        window.db_info_label.mousePressEvent = lambda event: window.on_view_database()
-    except Exception:
-        window.db_info_label = QLabel("БД: Не загружена")
+    # БД статистика загружается в фоне - окно показывается, не дожидаясь чтения файла БД
+    window.db_info_label = QLabel("БД: загрузка…")
+    window.load_database_info_async()
 
     info_layout.addWidget(window.db_info_label)
 
     # Индикатор режима
     window.mode_label = QLabel()
-    window.mode_label.setStyleSheet("QLabel { color: #a6e3a1; font-weight: bold; }")
+    window.mode_label.setObjectName("modeLabel")  # цвета меток футера - в _STATUS_LABELS_QSS (gui_qt)
     info_layout.addWidget(window.mode_label)
 
     info_layout.addStretch()
@@ -526,28 +523,29 @@ def create_footer(window: 'BOMCategorizerMainWindow') -> QWidget:
     if is_installed:
         # Для установленной версии Modern Edition открываем папку установки (где config_qt.json)
         location_label = QLabel("Установка (%APPDATA%)")
-        location_label.setStyleSheet("QLabel { color: #89b4fa; font-weight: bold; } QLabel:hover { color: #74c7ec; }")
+        location_label.setObjectName("dbLocationAppdata")
         location_label.setToolTip("Нажмите для открытия папки установки Modern Edition\n(где находится config_qt.json)")
-        location_label.mousePressEvent = lambda event: window.on_open_install_folder()
+        location_label.mousePressEvent = window.on_install_location_click
     else:
         # Для режима разработки открываем папку базы данных
         location_label = QLabel("Локальная")
-        location_label.setStyleSheet("QLabel { color: #f9e2af; font-weight: bold; } QLabel:hover { color: #f9e2af; }")
+        location_label.setObjectName("dbLocationLocal")
         location_label.setToolTip("Нажмите для открытия папки с выделенным файлом базы данных")
-        location_label.mousePressEvent = lambda event: window.on_open_db_folder()
+        location_label.mousePressEvent = window.on_db_location_click
     
     location_label.setCursor(Qt.PointingHandCursor)
     info_layout.addWidget(location_label)
 
     # Размер окна (кликабельная метка)
     window.size_label = QLabel(f"📐 {window.width()}×{window.height()}")
-    window.size_label.setStyleSheet("QLabel { color: #89b4fa; font-weight: bold; } QLabel:hover { color: #74c7ec; }")
+    window.size_label.setObjectName("windowSizeLabel")
     window.size_label.setCursor(Qt.PointingHandCursor)
-    window.size_label.mousePressEvent = lambda event: window.on_show_size_menu(event)
+    window.size_label.mousePressEvent = window.on_show_size_menu
     info_layout.addWidget(window.size_label)
 
     layout.addLayout(info_layout)
 
     footer.setLayout(layout)
+    footer.setUpdatesEnabled(True)
     return footer
 
@@ -97,14 +97,24 @@ def multiply_quantities(df: pd.DataFrame, multiplier: int) -> pd.DataFrame:
                     break
     
     if qty_col and qty_col in df.columns:
-        # Умножаем количество
-        for idx in df.index:
-            current_qty = df.loc[idx, qty_col]
-            if pd.notna(current_qty):
-                try:
-                    df.loc[idx, qty_col] = int(float(current_qty)) * multiplier
-                except (ValueError, TypeError):
-                    pass  # Оставляем как есть, если не можем преобразовать
+        # Умножаем количество одной операцией над колонкой; значения, которые
+        # не удается преобразовать в число, оставляем как есть
+        numeric = pd.to_numeric(df[qty_col], errors='coerce')
+        convertible = numeric.notna() & (numeric.abs() != float('inf'))
+        if convertible.any():
+            if not pd.api.types.is_numeric_dtype(df[qty_col]):
+                # В текстовую колонку (dtype str в pandas 3) числа не записать - нечисловые
+                # значения остаются в ней, поэтому переводим колонку в object
+                df[qty_col] = df[qty_col].astype(object)
+            # astype('int64') отбрасывает дробную часть, как int(float(...)); значения,
+            # которые после умножения не помещаются в int64, считаем через int Python
+            in_range = convertible & (numeric.abs() < 2 ** 63 // max(abs(multiplier), 1))
+            if in_range.any():
+                df.loc[in_range, qty_col] = numeric[in_range].astype('int64') * multiplier
+            out_of_range = convertible & ~in_range
+            if out_of_range.any():
+                df[qty_col] = df[qty_col].astype(object)
+                df.loc[out_of_range, qty_col] = [int(value) * multiplier for value in numeric[out_of_range]]
     
     return df
 
@@ -539,6 +549,22 @@ def aggregate_duplicate_items(df: pd.DataFrame, desc_col: str, combine_across_fi
         return df
 
 
+def _first_present(values: pd.DataFrame) -> pd.Series:
+    """
+    Возвращает для каждой строки первое непропущенное значение слева направо
+    
+    Args:
+        values: Колонки-кандидаты в порядке приоритета
+        
+    Returns:
+        Series с первым найденным значением (NaN, если в строке все пропущено)
+    """
+    merged = values.iloc[:, 0]
+    for i in range(1, values.shape[1]):
+        merged = merged.combine_first(values.iloc[:, i])
+    return merged
+
+
 def normalize_and_merge_columns(df: pd.DataFrame) -> tuple:
     """
     Нормализует названия колонок и объединяет дублирующиеся колонки
@@ -571,14 +597,13 @@ def normalize_and_merge_columns(df: pd.DataFrame) -> tuple:
     )]
     
     if len(possible_desc_cols) > 1:
-        def merge_desc(row):
-            for col in possible_desc_cols:
-                val = row.get(col)
-                if pd.notna(val) and str(val).strip():
-                    return val
-            return None
-        
-        df["_merged_description_"] = df.apply(merge_desc, axis=1)
+        # Первое непустое значение в строке: пустые строки превращаем в пропуски
+        # и заполняем пропуски из следующих колонок (по колонкам, без обхода строк)
+        desc_values = df[possible_desc_cols]
+        blank = desc_values.astype(str).apply(lambda col: col.str.strip() == '')
+        desc_values = desc_values.mask(blank.to_numpy())
+        
+        df["_merged_description_"] = _first_present(desc_values)
         for col in possible_desc_cols:
             if col in df.columns:
                 df = df.drop(columns=[col])
@@ -590,17 +615,10 @@ def normalize_and_merge_columns(df: pd.DataFrame) -> tuple:
     )]
     
     if len(possible_qty_cols) > 1:
-        def merge_qty(row):
-            for col in possible_qty_cols:
-                val = row.get(col)
-                if pd.notna(val):
-                    try:
-                        return float(val) if val != 0 or str(val).strip() == '0' else None
-                    except:
-                        pass
-            return None
+        # Первое значение в строке, которое преобразуется в число
+        qty_values = df[possible_qty_cols].apply(pd.to_numeric, errors='coerce')
         
-        df["_merged_qty_"] = df.apply(merge_qty, axis=1)
+        df["_merged_qty_"] = _first_present(qty_values).astype(float)
         for col in possible_qty_cols:
             if col in df.columns:
                 df = df.drop(columns=[col])
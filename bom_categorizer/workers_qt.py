@@ -5,11 +5,14 @@ Worker потоки для фоновых задач GUI
 Содержит классы для выполнения длительных операций в отдельных потоках:
 - ProcessingWorker: обработка BOM файлов
 - ComparisonWorker: сравнение BOM файлов
+- DatabaseTaskWorker: операции с базой данных (экспорт, импорт, резервная копия)
+- FileCheckWorker: проверка существования файлов при большом Drag & Drop
 """
 
 import os
 import sys
 from io import StringIO
+from typing import Callable
 from PySide6.QtCore import QThread, Signal
 
 
@@ -190,3 +193,33 @@ class ComparisonWorker(QThread):
             error_msg = f"❌ Ошибка при сравнении:\n{str(e)}\n\n{traceback.format_exc()}"
             self.finished.emit(error_msg, False)
 
+
+class DatabaseTaskWorker(QThread):
+    """Worker thread для длительных операций с базой данных"""
+    finished = Signal(bool, object, str)  # (success, result, error_message)
+    
+    def __init__(self, task: Callable[[], object]):
+        super().__init__()
+        self.task = task
+    
+    def run(self):
+        """Выполняет операцию в отдельном потоке"""
+        try:
+            result = self.task()
+        except Exception as e:
+            self.finished.emit(False, None, str(e))
+        else:
+            self.finished.emit(True, result, "")
+
+
+class FileCheckWorker(QThread):
+    """Worker thread для проверки существования перетащенных файлов"""
+    finished = Signal(list)  # существующие файлы в исходном порядке
+    
+    def __init__(self, paths: list):
+        super().__init__()
+        self.paths = paths
+    
+    def run(self):
+        """Проверяет файлы в отдельном потоке (stat() на каждый файл)"""
+        self.finished.emit([path for path in self.paths if os.path.isfile(path)])
@@ -9,7 +9,9 @@ from bom_categorizer.component_database import (
     save_component_database,
     add_component_to_database,
     get_component_category,
-    get_database_stats
+    get_database_stats,
+    get_database_history,
+    invalidate_database_stats_cache
 )
 
 
@@ -107,6 +109,22 @@ class TestComponentDatabase:
         assert stats['by_category']['capacitors'] == 1
         assert stats['by_category']['ics'] == 3
     
+    def test_stats_cache_invalidated_after_external_write(self, mock_component_database):
+        """Тест сброса кэша статистики после записи файла БД в обход модуля"""
+        import os
+        save_component_database({"R1": "resistors"})
+        assert get_database_stats()['by_category'] == {"resistors": 1}
+        assert len(get_database_history()) == 1
+        
+        # Замена файла с тем же размером и временем модификации (как после shutil.copy2)
+        db_stat = os.stat(mock_component_database)
+        text = mock_component_database.read_text(encoding='utf-8')
+        mock_component_database.write_text(text.replace('"R1": "resistors"', '"R1": "capacitor"'), encoding='utf-8')
+        os.utime(mock_component_database, ns=(db_stat.st_atime_ns, db_stat.st_mtime_ns))
+        
+        invalidate_database_stats_cache()
+        assert get_database_stats()['by_category'] == {"capacitor": 1}
+    
     def test_component_name_normalization(self, mock_component_database):
         """Тест нормализации названий компонентов"""
         save_component_database({})
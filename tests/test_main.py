@@ -0,0 +1,88 @@
+"""
+Тесты функций подготовки данных из main.py
+"""
+import pandas as pd
+from bom_categorizer.main import multiply_quantities, normalize_and_merge_columns
+
+
+class TestMultiplyQuantities:
+    """Тесты умножения количества на множитель"""
+
+    def test_multiplier_one_returns_unchanged(self):
+        """Множитель 1 не меняет данные"""
+        df = pd.DataFrame({"qty": [1, 2, 3]})
+        result = multiply_quantities(df, 1)
+        assert result["qty"].tolist() == [1, 2, 3]
+
+    def test_numeric_quantities_multiplied(self):
+        """Числовые значения умножаются"""
+        df = pd.DataFrame({"description": ["R1", "C1"], "qty": [2, 5]})
+        result = multiply_quantities(df, 3)
+        assert result["qty"].tolist() == [6, 15]
+
+    def test_string_and_fractional_quantities(self):
+        """Строки-числа преобразуются, дробная часть отбрасывается"""
+        df = pd.DataFrame({"qty": ["4", 2.7, "1.5"]})
+        result = multiply_quantities(df, 2)
+        assert result["qty"].tolist() == [8, 4, 2]
+
+    def test_unconvertible_and_empty_values_kept(self):
+        """Нечисловые и пустые значения остаются как есть"""
+        df = pd.DataFrame({"qty": ["3", "н/д", None]})
+        result = multiply_quantities(df, 10)
+        assert result["qty"].iloc[0] == 30
+        assert result["qty"].iloc[1] == "н/д"
+        assert pd.isna(result["qty"].iloc[2])
+
+    def test_text_column_with_unconvertible_values(self):
+        """Колонка строкового типа (pandas 3) с нечисловыми значениями обрабатывается"""
+        df = pd.DataFrame({"qty": pd.Series(["2", "н/д"], dtype="string")})
+        result = multiply_quantities(df, 3)
+        assert result["qty"].tolist() == [6, "н/д"]
+
+    def test_large_values_not_overflowed(self):
+        """Большие значения умножаются без переполнения int64"""
+        df = pd.DataFrame({"qty": ["1e19", "5000000000000000000", "1"]})
+        result = multiply_quantities(df, 2)
+        assert result["qty"].tolist() == [2 * 10 ** 19, 10 ** 19, 2]
+
+    def test_russian_column_name(self):
+        """Колонка количества находится по русскому названию"""
+        df = pd.DataFrame({"Наименование": ["R1"], "Количество": [7]})
+        result = multiply_quantities(df, 2)
+        assert result["Количество"].tolist() == [14]
+
+
+class TestNormalizeAndMergeColumns:
+    """Тесты объединения дублирующихся колонок"""
+
+    def test_descriptions_merged_skipping_blank(self):
+        """Берется первое непустое наименование в строке"""
+        df = pd.DataFrame({
+            "description": ["Резистор", "  ", None],
+            "description_2": ["игнор", "Конденсатор", "Диод"],
+        })
+        result, _, desc_col, *_ = normalize_and_merge_columns(df)
+        assert desc_col == "_merged_description_"
+        assert result[desc_col].tolist() == ["Резистор", "Конденсатор", "Диод"]
+        assert "description" not in result.columns
+        assert "description_2" not in result.columns
+
+    def test_all_blank_description_is_missing(self):
+        """Строка без наименований дает пропуск"""
+        df = pd.DataFrame({"description": [""], "description_2": [None]})
+        result, _, desc_col, *_ = normalize_and_merge_columns(df)
+        assert pd.isna(result[desc_col].iloc[0])
+
+    def test_quantities_merged_as_numbers(self):
+        """Берется первое числовое количество в строке"""
+        df = pd.DataFrame({
+            "description": ["R1", "C1", "D1"],
+            "qty": ["2", "н/д", None],
+            "qty_2": [5, "3", 0],
+        })
+        result, *_, qty_col, _ = normalize_and_merge_columns(df)
+        assert qty_col == "_merged_qty_"
+        assert result[qty_col].tolist() == [2.0, 3.0, 0.0]
+        assert "qty" not in result.columns
+        assert "qty_2" not in result.columns